@@ -0,0 +1,27 @@
+# File: file_entry.py
+# Description: A single file entry of the arXiv manifest.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class FileEntry:
+    """
+    A single processed file entry of the arXiv manifest.
+
+    The manifest stores its contents column-wise, a FileEntry is the row view of one entry.
+    The slots keep each instance small and the fields are read-only.
+    """
+
+    filename: str
+    size_bytes: int
+    timestamp_iso: str
+    year: int
+    month: int
+    sequence_number: int
+    n_submissions: int
+    md5: str
+    md5_contents: str
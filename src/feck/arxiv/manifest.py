@@ -4,13 +4,40 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
-from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+import functools
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+import re
+from typing import Iterator, Optional
 from zoneinfo import ZoneInfo
 
+from feck.arxiv.file_entry import FileEntry
 from feck.file.handler.xml_handler import XmlHandler
+from feck.file.hash_service import HashService, HashType
+
+
+_EASTERN = ZoneInfo('America/New_York')
+_UTC = timezone.utc  # fixed offset, converting to it needs no time zone rule lookup
+
+_MONTH_ABBREVIATIONS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+_WEEKDAY_ABBREVIATIONS = frozenset({'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'})
+
+_ARXIV_TOP_LEVEL_KEYS = frozenset({'arXivSRC'})
+_ARXIV_SRC_KEYS = frozenset({'file', 'timestamp'})
+_ARXIV_FILE_KEYS = ('content_md5sum', 'filename', 'first_item', 'last_item', 'md5sum', 'num_items', 'seq_num', 'size',
+                    'timestamp', 'yymm')
+
+_FILENAME_PATTERN = re.compile(r'src/arXiv_src_(\d{4})_(\d{3,})\.tar')
+_VALID_MONTHS = frozenset(f'{month:02d}' for month in range(1, 13))
+
+_FILE_ENTRY_BATCH_SIZE = 4096
+_PARALLEL_BATCH_THRESHOLD = 3  # batches processed in this process before starting worker processes
 
 
 class Manifest:
@@ -20,7 +47,8 @@ class Manifest:
 
     The manifest is stored as a dictionary with two main components:
       - 'metadata': A dictionary to store metadata information.
-      - 'contents': A list to store content-related data.
+      - 'contents': A dictionary of columns to store content-related data,
+        with one element per file entry in every column.
     """
 
     def __init__(self) -> None:
@@ -51,74 +79,244 @@ class Manifest:
 
         This private method initializes the manifest with the following structure:
           - 'metadata': An empty dictionary to hold metadata.
-          - 'contents': An empty list to hold content-related data.
+          - 'contents': Empty columns to hold content-related data.
         """
         self._manifest = {
             'metadata': {},
-            'contents': []
+            'contents': Manifest._get_empty_contents()
         }
 
-    def import_arxiv_xml(self, file_path: str) -> None:
+    @staticmethod
+    def _get_empty_contents() -> dict:
+        """
+        Get empty manifest contents.
+
+        The contents are stored as a structure of arrays: the integer columns are NumPy arrays
+        and the string columns are lists, all with one element per file entry.
+
+        :return: dict, dictionary of column name and empty column.
+        """
+
+        return {
+            'filename': [],
+            'size_bytes': np.empty(0, dtype=np.int64),
+            'timestamp_iso': [],
+            'year': np.empty(0, dtype=np.int16),
+            'month': np.empty(0, dtype=np.int8),
+            'sequence_number': np.empty(0, dtype=np.int32),
+            'n_submissions': np.empty(0, dtype=np.int32),
+            'md5': [],
+            'md5_contents': []
+        }
+
+    @staticmethod
+    def _get_contents_entry(contents: dict, index: int) -> FileEntry:
+        """
+        Get a single file entry from the manifest contents.
+
+        :param contents: dict, manifest contents stored column-wise.
+        :param index: int, index of the file entry.
+        :return: FileEntry, file entry assembled from the columns.
+        """
+
+        return FileEntry(
+            filename=contents['filename'][index],
+            size_bytes=int(contents['size_bytes'][index]),
+            timestamp_iso=contents['timestamp_iso'][index],
+            year=int(contents['year'][index]),
+            month=int(contents['month'][index]),
+            sequence_number=int(contents['sequence_number'][index]),
+            n_submissions=int(contents['n_submissions'][index]),
+            md5=contents['md5'][index],
+            md5_contents=contents['md5_contents'][index]
+        )
+
+    @staticmethod
+    def _concatenate_contents(contents_list: list) -> dict:
+        """
+        Concatenate manifest contents column by column.
+
+        :param contents_list: list, manifest contents stored column-wise, in order.
+        :return: dict, single manifest contents holding all entries.
+        """
+
+        concatenated_contents = Manifest._get_empty_contents()
+        for name, empty_column in concatenated_contents.items():
+            columns = [contents[name] for contents in contents_list]
+            if isinstance(empty_column, np.ndarray):
+                concatenated_contents[name] = np.concatenate([empty_column] + columns)
+            else:
+                concatenated_contents[name] = [value for column in columns for value in column]
+
+        return concatenated_contents
+
+    def import_arxiv_xml(self, path_or_file, max_workers: Optional[int] = None) -> None:
         """
         Load manifest from an arXiv XML file.
 
-        :param file_path: str, path to the arXiv XML file.
-            The file is generally called arXiv_src_manifest.xml
+        :param path_or_file: str, os.PathLike or binary file object, path to the arXiv XML file or the opened file.
+            The file is generally called arXiv_src_manifest.xml.
+            For an opened file the manifest filename is taken from its name attribute, None if it has none.
+        :param max_workers: int, maximum number of worker processes for the file entry batches, None default.
+            If None or 1, all file entries are processed in this process and no worker process is started.
+            If greater than 1, the batches of a large manifest are processed in worker processes while the parsing
+            continues. Malformed input raises the same exception as when processed in this process.
 
+        :raises ValueError: If the maximum number of workers is not positive.
         :raises FileNotFoundError: If the file is not found.
         :raises TypeError: If the file content is not in arXiv XML format.
         :raises ValueError: If a file entry is inconsistent.
         """
 
-        self.clear()
-
-        if not os.path.isfile(file_path):
-            raise FileNotFoundError('arXiv XML file not found')
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError('maximum number of workers must be positive')
 
-        xml_dict = XmlHandler.read_xml_to_dict(file_path)
+        self.clear()
 
-        if not Manifest._is_arxiv_keys_present(xml_dict):
-            raise TypeError('Entries missing in arXiv XML file')
+        if isinstance(path_or_file, (str, os.PathLike)):
+            if not os.path.isfile(path_or_file):
+                raise FileNotFoundError('arXiv XML file not found')
+            manifest_filename = os.path.basename(path_or_file)
+        else:
+            file_name = getattr(path_or_file, 'name', None)
+            manifest_filename = os.path.basename(file_name) if isinstance(file_name, str) else None
+
+        # stream the file entries and process them in batches, so the whole XML document is never held in memory.
+        # With several workers requested, large manifests hand the batches to worker processes while the parsing
+        # continues.
+        is_parallel = max_workers is not None and max_workers > 1
+        timestamp = None
+        file_entries = []
+        contents_batches = []
+        executor = None
+
+        try:
+            try:
+                for root_tag, item_tag, item in XmlHandler.iter_xml_items(path_or_file):
+                    if root_tag != 'arXivSRC':
+                        raise TypeError('Entries missing in arXiv XML file')
+
+                    if item_tag == 'file' and Manifest._is_file_entry_keys_present(item):
+                        file_entries.append(item)
+                        if len(file_entries) == _FILE_ENTRY_BATCH_SIZE:
+                            if (is_parallel and executor is None
+                                    and len(contents_batches) >= _PARALLEL_BATCH_THRESHOLD):
+                                executor = ProcessPoolExecutor(max_workers=max_workers)
+                            if executor is None:
+                                contents_batches.append(Manifest._process_file_entries(file_entries))
+                            else:
+                                contents_batches.append(executor.submit(Manifest._process_file_entries,
+                                                                        file_entries))
+                            file_entries = []
+                    elif item_tag == 'timestamp' and timestamp is None and isinstance(item, str):
+                        timestamp = item
+                    else:
+                        raise TypeError('Entries missing in arXiv XML file')
+
+                if timestamp is None or not (file_entries or contents_batches):
+                    raise TypeError('Entries missing in arXiv XML file')
+            except Exception:
+                # a failing batch ahead of this error would have raised first if processed in this process
+                Manifest._get_batch_results(contents_batches)
+                raise
+
+            contents_batches = Manifest._get_batch_results(contents_batches)
+            contents_batches.append(Manifest._process_file_entries(file_entries))
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         # set the metadata
         self._manifest['metadata'] = {
-            'manifest_filename': os.path.basename(file_path),
-            'timestamp_iso': Manifest._convert_arxiv_timestamp_to_iso(xml_dict['arXivSRC']['timestamp'])
+            'manifest_filename': manifest_filename,
+            'timestamp_iso': Manifest._convert_arxiv_timestamp_to_iso(timestamp)
         }
 
-        self._manifest['contents'] = [Manifest._process_file_entry(file_entry)
-                                      for file_entry in xml_dict['arXivSRC']['file']]
+        self._manifest['contents'] = Manifest._concatenate_contents(contents_batches)
+
+    @staticmethod
+    def _get_batch_results(contents_batches: list) -> list:
+        """
+        Get the contents of the processed batches of file entries, in order, waiting for the batches
+        handed to worker processes.
+
+        :param contents_batches: list, manifest contents dict or Future of a manifest contents dict of each batch
+        :return: list, manifest contents dict of each batch, in the order of the batches.
+
+        :raises ValueError: If a file entry is inconsistent, raised for the first failing batch in order.
+        """
+
+        return [batch.result() if isinstance(batch, Future) else batch for batch in contents_batches]
 
     @staticmethod
-    def _process_file_entry(file_entry: dict) -> dict:
+    def _process_file_entry(file_entry: dict) -> FileEntry:
         """
         Process a single arXiv manifest 'file' entry.
 
         :param file_entry: dict, entry in the 'file' list of the arXiv manifest XML dictionary.
-        :return: dict, processed entry to be added to the manifest.
+        :return: FileEntry, processed entry to be added to the manifest.
 
         :raises ValueError: If the file entry is inconsistent.
         """
 
-        if not Manifest._is_file_entry_consistent(file_entry):
+        return Manifest._get_contents_entry(Manifest._process_file_entries([file_entry]), 0)
+
+    @staticmethod
+    def _process_file_entries(file_entries: list) -> dict:
+        """
+        Process all arXiv manifest 'file' entries at once.
+
+        The integer fields are converted column by column with NumPy instead of entry by entry.
+
+        :param file_entries: list, entries in the 'file' list of the arXiv manifest XML dictionary.
+        :return: dict, manifest contents stored column-wise, in the order of the entries.
+
+        :raises ValueError: If a file entry is inconsistent or an integer field is out of range of its column.
+        """
+
+        if not Manifest._are_file_entries_consistent(file_entries).all():
             raise ValueError('Entry inconsistent')
 
-        local_dict = {
-            'filename': file_entry['filename'],
-            'size_bytes': int(file_entry['size']),
-            'timestamp_iso': Manifest._convert_arxiv_file_entry_timestamp_to_iso(file_entry['timestamp']),
-            'year': int(
-                f"19{file_entry['yymm'][:2]}" if int(file_entry['yymm'][:2]) > 90 else f"20{file_entry['yymm'][:2]}"),
-            'month': int(file_entry['yymm'][2:]),
-            'sequence_number': int(file_entry['seq_num']),
-            'n_submissions': int(file_entry['num_items']),
-            'hash': {
-                'MD5': file_entry['md5sum'],
-                'MD5_contents': file_entry['content_md5sum'],
-            }
+        n_entries = len(file_entries)
+        yymm = np.fromiter((entry['yymm'] for entry in file_entries), dtype=np.int64, count=n_entries)
+        yy = yymm // 100
+
+        contents = {
+            'filename': [entry['filename'] for entry in file_entries],
+            'size_bytes': Manifest._convert_integer_column(file_entries, 'size', np.int64),
+            'timestamp_iso': [Manifest._convert_arxiv_file_entry_timestamp_to_iso(entry['timestamp'])
+                              for entry in file_entries],
+            'year': (1900 + yy + 100 * (yy <= 90)).astype(np.int16),  # yy above 90 is in the 1900s
+            'month': (yymm % 100).astype(np.int8),
+            'sequence_number': Manifest._convert_integer_column(file_entries, 'seq_num', np.int32),
+            'n_submissions': Manifest._convert_integer_column(file_entries, 'num_items', np.int32),
+            'md5': [entry['md5sum'] for entry in file_entries],
+            'md5_contents': [entry['content_md5sum'] for entry in file_entries]
         }
 
-        return local_dict
+        return contents
+
+    @staticmethod
+    def _convert_integer_column(file_entries: list, key: str, dtype: type) -> np.ndarray:
+        """
+        Convert one integer field of all arXiv manifest 'file' entries to a NumPy column.
+
+        :param file_entries: list, entries in the 'file' list of the arXiv manifest XML dictionary.
+        :param key: str, key of the integer field in the file entries, such as 'num_items'
+        :param dtype: type, NumPy integer type of the column, such as np.int32
+        :return: np.ndarray, column of the field, in the order of the entries.
+
+        :raises ValueError: If the field of a file entry is out of range of the column type.
+        """
+
+        try:
+            return np.fromiter((entry[key] for entry in file_entries), dtype=dtype, count=len(file_entries))
+        except OverflowError:
+            dtype_info = np.iinfo(dtype)
+            for entry in file_entries:
+                if not dtype_info.min <= int(entry[key]) <= dtype_info.max:
+                    raise ValueError(f"Entry inconsistent: {key} {entry[key]} out of range in {entry['filename']}")
+            raise
 
     @staticmethod
     def _is_arxiv_keys_present(xml_dict: dict) -> bool:
@@ -147,21 +345,39 @@ class Manifest:
         :return: bool, True if valid, False otherwise.
         """
 
-        expected_top_level_keys = {'arXivSRC'}
-        expected_src_keys = {'file', 'timestamp'}
-        expected_file_keys = {'content_md5sum', 'filename', 'first_item', 'last_item', 'md5sum', 'num_items', 'seq_num',
-                              'size', 'timestamp', 'yymm'}
-        
-        is_valid = False
+        if xml_dict.keys() != _ARXIV_TOP_LEVEL_KEYS:
+            return False
+
+        src_dict = xml_dict['arXivSRC']
+        if src_dict.keys() != _ARXIV_SRC_KEYS:
+            return False
+
+        file_entries = src_dict['file']
+        if not isinstance(src_dict['timestamp'], str) or not isinstance(file_entries, list):
+            return False
+
+        # the generator short-circuits on the first invalid entry
+        is_valid = all(Manifest._is_file_entry_keys_present(entry) for entry in file_entries)
+
+        return is_valid
+
+    @staticmethod
+    def _is_file_entry_keys_present(file_entry) -> bool:
+        """
+        Determine if a single arXiv source manifest 'file' entry has all required keys.
+
+        The entry must be a dictionary with exactly the keys listed in `_is_arxiv_keys_present`,
+        each key has a string value.
 
-        if set(xml_dict.keys()) == expected_top_level_keys:
-            if set(xml_dict['arXivSRC'].keys()) == expected_src_keys:
-                if (isinstance(xml_dict['arXivSRC']['timestamp'], str)
-                        and isinstance(xml_dict['arXivSRC']['file'], list)):
-                    is_valid = all([set(entry.keys()) == expected_file_keys for entry in xml_dict['arXivSRC']['file']])
-                    if is_valid:
-                        is_valid = all([isinstance(value, str) for entry in xml_dict['arXivSRC']['file']
-                                        for _, value in entry.items()])
+        :param file_entry: entry in the 'file' list of the arXiv manifest XML dictionary.
+        :return: bool, True if valid, False otherwise.
+        """
+
+        # with the number of keys equal to the number of required keys, no other key can be present.
+        # The XML text is always a plain str, so the exact type check is enough.
+        is_valid = (isinstance(file_entry, dict)
+                    and len(file_entry) == len(_ARXIV_FILE_KEYS)
+                    and all(type(file_entry.get(key)) is str for key in _ARXIV_FILE_KEYS))
 
         return is_valid
 
@@ -177,31 +393,46 @@ class Manifest:
             The output format is for example '2025-04-07T08:58:03+00:00'
         """
 
-        eastern = ZoneInfo('America/New_York')
-        original_time_format = '%a %b %d %H:%M:%S %Y'
-        datetime_original = datetime.strptime(timestamp, original_time_format)
-        datetime_est = datetime_original.replace(tzinfo=eastern)
-        datetime_gmt = datetime_est.astimezone(ZoneInfo('UTC'))
+        # fixed layout 'Www Mmm dd HH:MM:SS yyyy', parsed by hand as strptime is slow
+        fields = timestamp.split()
+        if len(fields) != 5 or fields[0] not in _WEEKDAY_ABBREVIATIONS or fields[1] not in _MONTH_ABBREVIATIONS:
+            raise ValueError(f"timestamp '{timestamp}' does not match the arXiv manifest format")
+
+        time_fields = fields[3].split(':')
+        if len(time_fields) != 3:
+            raise ValueError(f"timestamp '{timestamp}' does not match the arXiv manifest format")
+
+        datetime_est = datetime(int(fields[4]), _MONTH_ABBREVIATIONS[fields[1]], int(fields[2]),
+                                int(time_fields[0]), int(time_fields[1]), int(time_fields[2]), tzinfo=_EASTERN)
+        datetime_gmt = datetime_est.astimezone(_UTC)
 
         return datetime_gmt.isoformat()
 
     @staticmethod
+    @functools.lru_cache(maxsize=65536)
     def _convert_arxiv_file_entry_timestamp_to_iso(timestamp: str) -> str:
         """
         Convert the arXiv XML file timestamp xml['arXivSRC']['file'][k]['timestamp'] from EST to ISO 8601 GMT.
 
+        The conversion is cached, as file entries of a manifest are generated in batches and often share a timestamp.
+
         :param timestamp: str, arXiv manifest timestamp.
             The arXiv manifest timestamp is initially in the same time zone as New York.
             The input format is for example '2010-12-23 00:13:59'
         :return: str, ISO 8601 GMT format timestamp.
             The output format is for example '2025-04-07T08:58:03+00:00'
+
+        :raises ValueError: If the timestamp does not match the format.
         """
 
-        eastern = ZoneInfo('America/New_York')
-        original_time_format = '%Y-%m-%d %H:%M:%S'
-        datetime_original = datetime.strptime(timestamp, original_time_format)
-        datetime_est = datetime_original.replace(tzinfo=eastern)
-        datetime_gmt = datetime_est.astimezone(ZoneInfo('UTC'))
+        # fixed layout 'yyyy-mm-dd HH:MM:SS', parsed by slicing as strptime is slow.
+        # The separators sit every third character from index 4 and are checked in a single comparison.
+        if len(timestamp) != 19 or timestamp[4:17:3] != '-- ::':
+            raise ValueError(f"timestamp '{timestamp}' does not match the arXiv manifest file format")
+
+        datetime_est = datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                                int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]), tzinfo=_EASTERN)
+        datetime_gmt = datetime_est.astimezone(_UTC)
 
         return datetime_gmt.isoformat()
 
@@ -218,83 +449,213 @@ class Manifest:
         :return: bool, True if consistent, False otherwise.
         """
 
-        is_consistent = True
+        match = _FILENAME_PATTERN.fullmatch(file_entry['filename'])
+        if match is None:
+            return False
 
-        seq_num = int(file_entry['seq_num'])
-        yymm = file_entry['yymm']
-        entry_filename = file_entry['filename']
-        generated_filename = f"src/arXiv_src_{yymm}_{seq_num:03d}.tar"  # consistency check
+        yymm, sequence_digits = match.groups()
 
-        if entry_filename != generated_filename:
-            is_consistent = False
+        # the sequence number is zero padded to three digits in the filename
+        is_consistent = (yymm == file_entry['yymm']
+                         and sequence_digits == f"{int(file_entry['seq_num']):03d}"
+                         and yymm[2:] in _VALID_MONTHS)
 
-        month = int(file_entry['yymm'][2:])
+        return is_consistent
 
-        if month <= 0 or month > 12:
-            is_consistent = False
+    @staticmethod
+    def _are_file_entries_consistent(file_entries: list) -> np.ndarray:
+        """
+        Determines if each file entry is consistent within the manifest, see _is_file_entry_consistent.
+
+        The month and sequence number checks are evaluated on NumPy arrays over all entries, and the filename
+        is compared against the one generated from yymm and seq_num instead of being matched with the pattern.
+        If the fields cannot be converted in bulk, each entry is checked with _is_file_entry_consistent.
+
+        :param file_entries: list, entries in the 'file' list of the arXiv manifest XML dictionary
+        :return: np.ndarray, bool array, True for each consistent entry, in the order of the entries.
+        """
+
+        n_entries = len(file_entries)
+        yymm_list = [entry['yymm'] for entry in file_entries]
+        yymm_bytes = ''.join(yymm_list).encode('ascii', errors='replace')
+
+        try:
+            if len(yymm_bytes) != 4 * n_entries:
+                raise ValueError('yymm not four characters')
+            sequence_number = np.fromiter((entry['seq_num'] for entry in file_entries), dtype=np.int64,
+                                          count=n_entries)
+        except (ValueError, OverflowError):
+            return np.fromiter((Manifest._is_file_entry_consistent(entry) for entry in file_entries), dtype=bool,
+                               count=n_entries)
+
+        digits = np.frombuffer(yymm_bytes, dtype=np.uint8).reshape(n_entries, 4) - ord('0')
+        month = digits[:, 2].astype(np.int64) * 10 + digits[:, 3]
+        is_consistent = (digits < 10).all(axis=1) & (month >= 1) & (month <= 12) & (sequence_number >= 0)
+
+        # the sequence number is zero padded to three digits in the filename
+        is_consistent &= np.fromiter((entry['filename'] == f'src/arXiv_src_{yymm}_{seq:03d}.tar'
+                                      for entry, yymm, seq in zip(file_entries, yymm_list, sequence_number.tolist())),
+                                     dtype=bool, count=n_entries)
 
         return is_consistent
 
+    def iter_file_entries(self) -> Iterator[FileEntry]:
+        """
+        Iterate over the file entries of the manifest, each assembled from the columns only when it is reached.
+
+        :return: Iterator[FileEntry], file entries in the order of the manifest.
+        """
+
+        contents = self._manifest['contents']
+
+        # columns are converted to Python values once, rather than one NumPy scalar at a time
+        columns = zip(contents['filename'], contents['size_bytes'].tolist(), contents['timestamp_iso'],
+                      contents['year'].tolist(), contents['month'].tolist(), contents['sequence_number'].tolist(),
+                      contents['n_submissions'].tolist(), contents['md5'], contents['md5_contents'])
+
+        for row in columns:
+            yield FileEntry(*row)
+
+    def to_arrays(self) -> dict:
+        """
+        Get the manifest contents with every column as a NumPy array, for vectorized analytics.
+
+        The integer columns are returned as stored, they are shared with the manifest and must not be modified.
+
+        :return: dict, one NumPy array per column, in the order of the file entries:
+            - 'filename': str array
+            - 'size_bytes': int64 array
+            - 'timestamp': datetime64[s] array, UTC
+            - 'year': int16 array
+            - 'month': int8 array
+            - 'sequence_number': int32 array
+            - 'n_submissions': int32 array
+            - 'md5': S32 array, hexadecimal MD5 as fixed-width bytes
+            - 'md5_contents': S32 array, hexadecimal MD5 as fixed-width bytes
+        """
+
+        contents = self._manifest['contents']
+
+        # the ISO timestamps are all UTC, drop the '+00:00' offset which NumPy does not parse
+        arrays = {
+            'filename': np.array(contents['filename'], dtype=str),
+            'size_bytes': contents['size_bytes'],
+            'timestamp': np.array([timestamp_iso[:19] for timestamp_iso in contents['timestamp_iso']],
+                                  dtype='datetime64[s]'),
+            'year': contents['year'],
+            'month': contents['month'],
+            'sequence_number': contents['sequence_number'],
+            'n_submissions': contents['n_submissions'],
+            'md5': np.array(contents['md5'], dtype='S32'),
+            'md5_contents': np.array(contents['md5_contents'], dtype='S32')
+        }
+
+        return arrays
+
+    def verify_hashes(self, root_directory: str, fail_fast: bool = False) -> Iterator[tuple]:
+        """
+        Verify the MD5 hash of each file of the manifest, lazily, in the order of the file entries.
+
+        Each file is only hashed when its result is requested, so a caller stopping at the first mismatch
+        hashes no further files.
+
+        :param root_directory: str, directory the manifest filenames are relative to
+        :param fail_fast: bool, stop after the first file that is missing or does not match, False default
+        :return: Iterator[tuple], (filename, is_valid) for each file entry,
+            is_valid is False if the file is missing or its MD5 hash does not match the manifest.
+        """
+
+        contents = self._manifest['contents']
+
+        for filename, md5 in zip(contents['filename'], contents['md5']):
+            try:
+                is_valid = HashService.calculate_file_hash(os.path.join(root_directory, filename),
+                                                           HashType.HASH_TYPE_MD5) == md5
+            except FileNotFoundError:
+                is_valid = False
+
+            yield filename, is_valid
+
+            if fail_fast and not is_valid:
+                return
+
     def get_statistics(self) -> dict:
         """
         Get summary statistics of the manifest.
 
         :return: dict, summary statistics of the manifest.
-            The dictionary key is a (year, month) tuple.
+            The dictionary key is a (year, month) tuple, in chronological order.
             The dictionary value is also a dictionary with the keys 'size_bytes' and 'n_submissions'.
         """
 
-        statistics = dict()
-        for entry in self._manifest['contents']:
-            key = (entry['year'], entry['month'])
-            if key not in statistics:
-                statistics[key] = {'size_bytes': 0, 'n_submissions': 0}
-            statistics[key]['size_bytes'] += entry['size_bytes']
-            statistics[key]['n_submissions'] += entry['n_submissions']
+        year, month, size_bytes, n_submissions = self._get_statistics_arrays()
+
+        statistics = {
+            (group_year, group_month): {'size_bytes': group_size_bytes, 'n_submissions': group_n_submissions}
+            for group_year, group_month, group_size_bytes, group_n_submissions
+            in zip(year.tolist(), month.tolist(), size_bytes.tolist(), n_submissions.tolist())
+        }
 
         return statistics
 
+    def _get_statistics_arrays(self) -> tuple:
+        """
+        Get summary statistics of the manifest as NumPy arrays, one element per (year, month).
+
+        :return: tuple, (year, month, size_bytes, n_submissions) int64 arrays, in chronological order.
+        """
+
+        contents = self._manifest['contents']
+
+        # group the entries by a single integer key yyyymm. The entries are sorted by the key, a manifest is
+        # usually in order already, and each run of equal keys is summed in one reduction, exactly in int64.
+        year_month = contents['year'].astype(np.int64) * 100 + contents['month']
+        if len(year_month) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty, empty
+
+        order = np.argsort(year_month, kind='stable')
+        sorted_year_month = year_month[order]
+        group_starts = np.flatnonzero(np.diff(sorted_year_month, prepend=sorted_year_month[0] - 1))
+        unique_year_month = sorted_year_month[group_starts]
+
+        size_bytes = np.add.reduceat(contents['size_bytes'][order].astype(np.int64), group_starts)
+        n_submissions = np.add.reduceat(contents['n_submissions'][order].astype(np.int64), group_starts)
+
+        return unique_year_month // 100, unique_year_month % 100, size_bytes, n_submissions
+
     def plot_summary_statistics(self) -> None:
         """
         Plot summary statistics of the manifest.
 
-        The generated plots are:
+        The generated plots, stacked in a single figure, are:
             - the number of submissions per month
             - size of all submissions per month in GB
             - average submission size in MB
         """
 
-        statistics = self.get_statistics()
+        year, month, size_bytes, n_submissions = self._get_statistics_arrays()
 
-        dates = [datetime(year, month, 1) for year, month in statistics.keys()]
+        # first day of each month, datetime64 years count from 1970
+        dates = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]') + (month - 1).astype('timedelta64[M]')
 
-        # Extract values for each metric
-        n_submissions = np.array([entry['n_submissions'] for entry in statistics.values()])
-        size_bytes = np.array([entry['size_bytes'] for entry in statistics.values()])
+        # values, color, label, y-axis label and title of each plot, all computed once over the month arrays
+        plots = (
+            (n_submissions, None, 'n_submissions', 'Number of Submissions', 'Number of Submissions per Month'),
+            (1.0e-9 * size_bytes, 'orange', 'size_bytes', 'Size (GB)', 'Size in GB per Month'),
+            (1.0e-6 * (size_bytes / n_submissions), 'green', 'size_bytes', 'Average Submission Size (MB)',
+             'Averaged Monthly Submission Size in MB')
+        )
 
-        plt.figure(figsize=(10, 5))
-        plt.plot(dates, n_submissions, '.', label='n_submissions')
-        plt.gcf().autofmt_xdate()
-        plt.xlabel('Date (Year-Month)')
-        plt.ylabel('Number of Submissions')
-        plt.title('Number of Submissions per Month')
-        plt.grid(True)
-        plt.show()
+        figure, axes_list = plt.subplots(len(plots), 1, figsize=(10, 15))
 
-        plt.figure(figsize=(10, 5))
-        plt.plot(dates, 1.0e-9 * size_bytes, '.', color='orange', label='size_bytes')
-        plt.gcf().autofmt_xdate()
-        plt.xlabel('Date (Year-Month)')
-        plt.ylabel('Size (GB)')
-        plt.title('Size in GB per Month')
-        plt.grid(True)
-        plt.show()
+        for axes, (values, color, label, ylabel, title) in zip(axes_list, plots):
+            axes.plot(dates, values, '.', color=color, label=label)
+            axes.set_xlabel('Date (Year-Month)')
+            axes.set_ylabel(ylabel)
+            axes.set_title(title)
+            axes.grid(True)
+            axes.tick_params(axis='x', labelrotation=30)  # the axes do not share the date axis
 
-        plt.figure(figsize=(10, 5))
-        plt.plot(dates, 1.0e-6 * (size_bytes / n_submissions), '.', color='green', label='size_bytes')
-        plt.gcf().autofmt_xdate()
-        plt.xlabel('Date (Year-Month)')
-        plt.ylabel('Average Submission Size (MB)')
-        plt.title('Averaged Monthly Submission Size in MB')
-        plt.grid(True)
+        figure.tight_layout()
         plt.show()
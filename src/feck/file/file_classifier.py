@@ -0,0 +1,89 @@
+# File: file_classifier.py
+# Description: File type classification of the files in a directory.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+import os
+from types import MappingProxyType
+from typing import Iterator
+
+from feck.file.file_type import FileType
+from feck.file.handler.pdf_handler import PdfHandler
+from feck.file.handler.postscript_handler import PostscriptHandler
+from feck.file.handler.xml_handler import XmlHandler
+
+
+class FileClassifier:
+    """
+    A class to determine the file types of the files in a directory.
+
+    The directory is listed once and the file type is looked up from the extension. Only files with an extension
+    known to a file handler are opened, to confirm their format, all other files are not touched.
+    """
+
+    # read-only, the keys are lowercase, built once from the extension maps of the file handlers
+    _handler_by_extension = MappingProxyType({
+        file_extension: file_handler
+        for file_handler in (PdfHandler, PostscriptHandler, XmlHandler)
+        for file_extension in file_handler.get_file_extension_map()
+    })
+
+    @staticmethod
+    def get_file_type_from_extension(file_extension: str) -> FileType:
+        """
+        Determine the file type from the file extension, over all file handlers.
+
+        :param file_extension: str, file extension
+        :return: FileType, file type determined by the extension.
+            If the file type is unknown, return FILE_TYPE_UNKNOWN.
+        """
+
+        if not file_extension.islower():
+            file_extension = file_extension.lower()
+
+        file_handler = FileClassifier._handler_by_extension.get(file_extension)
+        if file_handler is None:
+            return FileType.FILE_TYPE_UNKNOWN
+
+        return file_handler.get_file_type_from_extension(file_extension)[0]
+
+    @staticmethod
+    def classify_directory(directory_path: str, verify_format: bool = True) -> Iterator[tuple]:
+        """
+        Determine the file types of the files in a directory, without descending into subdirectories.
+
+        :param directory_path: str, path to the directory
+        :param verify_format: bool, True to confirm the format of files with a known extension, True default.
+            If True, a file whose format does not match its extension is FILE_TYPE_UNKNOWN.
+            If False, no file is opened and the file type is determined by the extension only.
+        :return: Iterator[tuple], (file path, FileType) for each file in the directory, in directory order.
+
+        :raises FileNotFoundError: If the directory is not found.
+        """
+
+        try:
+            directory_iterator = os.scandir(directory_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError('directory not found')
+
+        with directory_iterator:
+            for entry in directory_iterator:
+                # the directory listing already holds the entry type, so most entries need no stat
+                if not entry.is_file():
+                    continue
+
+                file_extension = os.path.splitext(entry.name)[1]
+                if not file_extension.islower():
+                    file_extension = file_extension.lower()
+
+                file_handler = FileClassifier._handler_by_extension.get(file_extension)
+                if file_handler is None:
+                    yield entry.path, FileType.FILE_TYPE_UNKNOWN
+                    continue
+
+                file_type = file_handler.get_file_type_from_extension(file_extension)[0]
+                if verify_format and file_handler.get_file_type_from_format(entry.path) == FileType.FILE_TYPE_UNKNOWN:
+                    file_type = FileType.FILE_TYPE_UNKNOWN
+
+                yield entry.path, file_type
@@ -5,22 +5,38 @@
 # Licensed under the MIT License. See the LICENSE file for more details.
 
 
-from enum import Enum
+from enum import IntEnum
 
-class FileType(Enum):
+class FileType(IntEnum):
     """
     Enumeration for file type categories.
 
     This enum is used to categorize files based on their extension or format.
+    The members are integers, so hashing and comparing them is cheap.
+    The label property gives the string form used for serialization, for example 'PDF'.
     """
 
-    FILE_TYPE_UNKNOWN = 'UNKNOWN'
+    FILE_TYPE_UNKNOWN = 0
 
-    FILE_TYPE_PDF = 'PDF'
+    FILE_TYPE_PDF = 1
 
-    FILE_TYPE_POSTSCRIPT_PS = 'POSTSCRIPT_PS'
-    FILE_TYPE_POSTSCRIPT_EPS = 'POSTSCRIPT_EPS'
-    FILE_TYPE_POSTSCRIPT_EPSF = 'POSTSCRIPT_EPSF'
-    FILE_TYPE_POSTSCRIPT_EPSI = 'POSTSCRIPT_EPSI'
+    FILE_TYPE_POSTSCRIPT_PS = 2
+    FILE_TYPE_POSTSCRIPT_EPS = 3
+    FILE_TYPE_POSTSCRIPT_EPSF = 4
+    FILE_TYPE_POSTSCRIPT_EPSI = 5
 
-    FILE_TYPE_XML = 'XML'
+    FILE_TYPE_XML = 6
+
+    @property
+    def label(self) -> str:
+        """
+        Get the label of the file type, the name without the FILE_TYPE_ prefix.
+
+        :return: str, label of the file type, for example 'POSTSCRIPT_PS'
+        """
+
+        return _FILE_TYPE_LABELS[self]
+
+
+# labels indexed by the file type value, built once
+_FILE_TYPE_LABELS = tuple(file_type.name.removeprefix('FILE_TYPE_') for file_type in FileType)
@@ -0,0 +1,158 @@
+# File: format_sniffer.py
+# Description: File format detection from magic numbers.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
+import re
+import stat
+
+from feck.file.file_type import FileType
+
+
+class FormatSniffer:
+    """
+    A class to determine the file type from the magic number at the start of a file.
+
+    The header of the file is read once and compared against the magic numbers of all supported formats,
+    instead of each file handler opening and reading the file separately.
+    """
+
+    _magic_number_map = (
+        (b'%PDF-', FileType.FILE_TYPE_PDF),
+        (b'%!PostScript', FileType.FILE_TYPE_POSTSCRIPT_PS),
+        (b'%!PS-Adobe-3.0', FileType.FILE_TYPE_POSTSCRIPT_PS),
+        (b'%!PS-Adobe-2.0', FileType.FILE_TYPE_POSTSCRIPT_PS),
+        (b'%!PS-Adobe-1.0', FileType.FILE_TYPE_POSTSCRIPT_PS),
+        (b'\xc5\xd0\xd3\xc6', FileType.FILE_TYPE_POSTSCRIPT_PS),  # DOS binary header of an encapsulated postscript file
+        (b'<?xml', FileType.FILE_TYPE_XML)
+    )
+
+    # one alternation of all magic numbers, each in its own group, so the header is matched in a single pass.
+    # The postscript header comment is a text line, leading blanks on that line are tolerated.
+    _magic_number_pattern = re.compile(b'|'.join(
+        (rb'[ \t\f\v]*' if magic_number.startswith(b'%!') else b'') + b'(' + re.escape(magic_number) + b')'
+        for magic_number, _ in _magic_number_map))
+
+    _header_size = 64  # room for leading blanks before the postscript header comment
+
+    @staticmethod
+    def read_header(file_path: str) -> bytes:
+        """
+        Read the header of the file, long enough to hold any supported magic number.
+
+        The header is cached per path, modification time and size, so sniffing the same unchanged file again,
+        for example from several file handlers, does not read it again.
+
+        :param file_path: str, path to the file
+        :return: bytes, leading bytes of the file, shorter if the file is shorter.
+
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError('file not found')
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise FileNotFoundError('file not found')
+
+        return FormatSniffer._read_header_cached(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _read_header_cached(file_path: str, modification_time_ns: int, file_size: int) -> bytes:
+        """
+        Read the header of the file, cached.
+
+        :param file_path: str, path to the file
+        :param modification_time_ns: int, modification time of the file in nanoseconds, part of the cache key
+        :param file_size: int, size of the file in bytes, part of the cache key
+        :return: bytes, leading bytes of the file, shorter if the file is shorter.
+
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        # unbuffered read, no file object is needed for a few bytes
+        try:
+            file_descriptor = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            raise FileNotFoundError('file not found')
+
+        try:
+            header = os.read(file_descriptor, FormatSniffer._header_size)
+        finally:
+            os.close(file_descriptor)
+
+        return header
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear the cached file headers.
+        """
+
+        FormatSniffer._read_header_cached.cache_clear()
+
+    @staticmethod
+    def get_file_type_from_header(header: bytes) -> FileType:
+        """
+        Determine the file type from the header of a file.
+
+        An XML declaration only indicates XML, the document itself may still not be well-formed.
+
+        :param header: bytes, leading bytes of the file
+        :return: FileType, file type determined by the magic number.
+            If the file type is unknown, return FILE_TYPE_UNKNOWN.
+        """
+
+        match = FormatSniffer._magic_number_pattern.match(header)
+        if match is None:
+            return FileType.FILE_TYPE_UNKNOWN
+
+        return FormatSniffer._magic_number_map[match.lastindex - 1][1]
+
+    @staticmethod
+    def sniff_file_type(file_path: str) -> FileType:
+        """
+        Determine the file type from the magic number of the file.
+
+        :param file_path: str, path to the file
+        :return: FileType, file type determined by the magic number.
+            If the file type is unknown, return FILE_TYPE_UNKNOWN.
+
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        return FormatSniffer.get_file_type_from_header(FormatSniffer.read_header(file_path))
+
+    @staticmethod
+    def sniff_file_types(file_paths: list, max_workers: int = 64) -> list:
+        """
+        Determine the file types of many files from their magic numbers.
+
+        The small header reads are issued concurrently from a thread pool, so the latency of the
+        open/read/close round-trips overlaps across files instead of adding up.
+
+        :param file_paths: list, paths to the files
+        :param max_workers: int, maximum number of concurrent reads, 64 default
+        :return: list, file type FileType of each file, in the order of the paths.
+
+        :raises ValueError: If the maximum number of workers is not positive.
+        :raises FileNotFoundError: If a file is not found.
+        """
+
+        if max_workers <= 0:
+            raise ValueError('maximum number of workers must be positive')
+
+        if len(file_paths) <= 1:
+            return [FormatSniffer.sniff_file_type(file_path) for file_path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            file_types = list(executor.map(FormatSniffer.sniff_file_type, file_paths))
+
+        return file_types
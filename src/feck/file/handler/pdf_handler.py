@@ -4,10 +4,11 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
-
-import os
+from types import MappingProxyType
+from typing import Mapping
 
 from feck.file.file_type import FileType
+from feck.file.format_sniffer import FormatSniffer
 
 
 class PdfHandler:
@@ -15,15 +16,18 @@ class PdfHandler:
     A class to handle portable document format (PDF) files.
     """
 
-    _file_extension_map = {
+    # read-only, the keys are lowercase
+    _file_extension_map = MappingProxyType({
         '.pdf': [FileType.FILE_TYPE_PDF]
-    }
+    })
+
+    _file_type_unknown = [FileType.FILE_TYPE_UNKNOWN]
 
     @staticmethod
-    def get_file_extension_map() -> dict:
+    def get_file_extension_map() -> Mapping:
         """
         Get the file extension map.
-        :return: dict, dictionary of file extension and a list of associated file types.
+        :return: Mapping, read-only dictionary of file extension and a list of associated file types.
         """
 
         return PdfHandler._file_extension_map
@@ -38,7 +42,10 @@ class PdfHandler:
             If the file type is unknown, return FILE_TYPE_UNKNOWN.
         """
 
-        return PdfHandler._file_extension_map.get(file_extension.lower(), [FileType.FILE_TYPE_UNKNOWN])
+        if not file_extension.islower():
+            file_extension = file_extension.lower()
+
+        return PdfHandler._file_extension_map.get(file_extension, PdfHandler._file_type_unknown)
 
     @staticmethod
     def get_file_type_from_format(file_path: str) -> FileType:
@@ -70,15 +77,6 @@ class PdfHandler:
         :raises FileNotFoundError: If the file is not found.
         """
 
-        is_file_found = os.path.isfile(file_path)
-        if not is_file_found:
-            raise FileNotFoundError('file not found')
-
-        is_pdf_file = False
-
-        with open(file_path, 'rb') as file:
-            header = file.read(5)
-            if header == b'%PDF-':
-                is_pdf_file = True
+        is_pdf_file = (FormatSniffer.sniff_file_type(file_path) == FileType.FILE_TYPE_PDF)
 
         return is_pdf_file
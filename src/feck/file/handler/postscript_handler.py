@@ -4,9 +4,11 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
-import os
+from types import MappingProxyType
+from typing import Mapping
 
 from feck.file.file_type import FileType
+from feck.file.format_sniffer import FormatSniffer
 
 
 class PostscriptHandler:
@@ -14,18 +16,21 @@ class PostscriptHandler:
     A class to handle postscript (PS) files.
     """
 
-    _file_extension_map = {
+    # read-only, the keys are lowercase
+    _file_extension_map = MappingProxyType({
         '.ps' : [FileType.FILE_TYPE_POSTSCRIPT_PS],
         '.eps': [FileType.FILE_TYPE_POSTSCRIPT_EPS],
         '.epsf': [FileType.FILE_TYPE_POSTSCRIPT_EPSF],
         '.epsi': [FileType.FILE_TYPE_POSTSCRIPT_EPSI]
-    }
+    })
+
+    _file_type_unknown = [FileType.FILE_TYPE_UNKNOWN]
 
     @staticmethod
-    def get_file_extension_map() -> dict:
+    def get_file_extension_map() -> Mapping:
         """
         Get the file extension map.
-        :return: dict, dictionary of file extension and a list of associated file types.
+        :return: Mapping, read-only dictionary of file extension and a list of associated file types.
         """
 
         return PostscriptHandler._file_extension_map
@@ -40,7 +45,10 @@ class PostscriptHandler:
             If the file type is unknown, return FILE_TYPE_UNKNOWN.
         """
 
-        return PostscriptHandler._file_extension_map.get(file_extension.lower(), [FileType.FILE_TYPE_UNKNOWN])
+        if not file_extension.islower():
+            file_extension = file_extension.lower()
+
+        return PostscriptHandler._file_extension_map.get(file_extension, PostscriptHandler._file_type_unknown)
 
     @staticmethod
     def get_file_type_from_format(file_path: str) -> FileType:
@@ -72,26 +80,9 @@ class PostscriptHandler:
                  The method shall raise an exception if the file does not exist or cannot be read.
 
         :raises FileNotFoundError: If the file is not found.
+        :raises OSError: If the file cannot be read.
         """
 
-        postscript_headers = [
-            "%!PostScript",
-            "%!PS-Adobe-3.0",
-            "%!PS-Adobe-2.0",
-            "%!PS-Adobe-1.0"
-        ]
-
-        is_file_found = os.path.isfile(file_path)
-        if not is_file_found:
-            raise FileNotFoundError('file not found')
-
-        is_postscript_file = False
-        try:
-            with open(file_path, 'r') as file:
-                first_line = file.readline().strip()
-                is_postscript_file = any(first_line.startswith(header) for header in postscript_headers)
-        except Exception as e:
-            print(f"Error reading file: {e}")
-            return is_postscript_file
+        is_postscript_file = (FormatSniffer.sniff_file_type(file_path) == FileType.FILE_TYPE_POSTSCRIPT_PS)
 
         return is_postscript_file
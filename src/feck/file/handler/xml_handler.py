@@ -4,27 +4,60 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import codecs
+import contextlib
+import functools
 import os
+import re
+import stat
+from types import MappingProxyType
+from typing import Iterator, Mapping
+import defusedxml as defusedxml_implementation
+import defusedxml.ElementTree as defusedxml_element_tree_implementation
 import xml.etree.ElementTree as xml_element_tree_implementation
+import xml.parsers.expat as xml_expat_implementation
 import xmltodict as xmltodict_implementation
 
 from feck.file.file_type import FileType
 
 
+class _NullXmlTarget:
+    """
+    Parser target that discards the parsed document, used to check an XML document without building it.
+    """
+
+    def close(self) -> None:
+        """
+        Finish the parsed document.
+        """
+
+        return None
+
+
 class XmlHandler:
     """
     A class to handle Extensible Markup Language (XML) files.
     """
 
-    _file_extension_map = {
+    # read-only, the keys are lowercase
+    _file_extension_map = MappingProxyType({
         '.xml': [FileType.FILE_TYPE_XML]
-    }
+    })
+
+    _file_type_unknown = [FileType.FILE_TYPE_UNKNOWN]
+
+    _sniff_size = 512
+    _read_size = 65536
+
+    # after whitespace, a document opens with an XML declaration, a comment, a document type declaration
+    # or the start tag of the root element
+    _xml_prolog_pattern = re.compile(rb'[ \t\r\n]*<(?:\?xml[ \t\r\n]|!--|!DOCTYPE[ \t\r\n]|[A-Za-z_:])')
 
     @staticmethod
-    def get_file_extension_map() -> dict:
+    def get_file_extension_map() -> Mapping:
         """
         Get the file extension map.
-        :return: dict, dictionary of file extension and a list of associated file types.
+        :return: Mapping, read-only dictionary of file extension and a list of associated file types.
         """
 
         return XmlHandler._file_extension_map
@@ -39,7 +72,10 @@ class XmlHandler:
             If the file type is unknown, return FILE_TYPE_UNKNOWN.
         """
 
-        return XmlHandler._file_extension_map.get(file_extension.lower(), [FileType.FILE_TYPE_UNKNOWN])
+        if not file_extension.islower():
+            file_extension = file_extension.lower()
+
+        return XmlHandler._file_extension_map.get(file_extension, XmlHandler._file_type_unknown)
 
     @staticmethod
     def get_file_type_from_format(file_path: str) -> FileType:
@@ -60,28 +96,121 @@ class XmlHandler:
         return file_type_category
 
     @staticmethod
-    def is_xml_format(file_path: str) -> bool:
+    def is_xml_format(file_path: str, strict: bool=True) -> bool:
         """
         Determine if the file content is in Extensible Markup Language (XML) format.
 
+        In strict mode the whole document is checked to be well-formed. The result is cached per path,
+        modification time and size, so probing the same unchanged file again does not parse it again.
+        Otherwise only the leading bytes are matched against the start of an XML document, which is constant
+        in the file size but accepts truncated or malformed documents.
+
         :param file_path: str, path to the file
+        :param strict: bool, True to check the whole document, False to check the leading bytes only, True default
         :return: bool, True if the file is in XML format, False otherwise.
 
         :raises FileNotFoundError: If the file is not found.
         """
 
-        if not os.path.isfile(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError('file not found')
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise FileNotFoundError('file not found')
+
+        if not strict:
+            return XmlHandler._is_xml_prolog(file_path)
+
+        return XmlHandler._is_xml_format_cached(file_path, file_stat.st_mtime_ns, file_stat.st_size)
+
+    @staticmethod
+    def _is_xml_prolog(file_path: str) -> bool:
+        """
+        Determine if the leading bytes of the file start an Extensible Markup Language (XML) document.
+
+        :param file_path: str, path to the file
+        :return: bool, True if the file starts like an XML document, False otherwise.
+
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        try:
+            file_descriptor = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
             raise FileNotFoundError('file not found')
 
+        try:
+            head = os.read(file_descriptor, XmlHandler._sniff_size)
+        finally:
+            os.close(file_descriptor)
+
+        if head.startswith(codecs.BOM_UTF8):
+            head = head[len(codecs.BOM_UTF8):]
+        elif head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            # a truncated last character is dropped, only the start of the document is matched
+            head = head.decode('utf-16', errors='ignore').encode('utf-8', errors='ignore')
+
+        return XmlHandler._xml_prolog_pattern.match(head) is not None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _is_xml_format_cached(file_path: str, modification_time_ns: int, file_size: int) -> bool:
+        """
+        Determine if the file content is in Extensible Markup Language (XML) format, cached.
+
+        :param file_path: str, path to the file
+        :param modification_time_ns: int, modification time of the file in nanoseconds, part of the cache key
+        :param file_size: int, size of the file in bytes, part of the cache key
+        :return: bool, True if the file is in XML format, False otherwise.
+        """
+
+        # the parser only checks the document, its target builds no elements. Entity declarations are
+        # rejected and external resources are never fetched, so the check stays linear in the file size.
+        parser = defusedxml_element_tree_implementation.DefusedXMLParser(target=_NullXmlTarget())
+
         try:
             with open(file_path, 'r') as file_handle:
-                xml_element_tree_implementation.parse(file_handle)
+                if file_size > XmlHandler._read_size:
+                    XmlHandler._advise_sequential_read(file_handle)
+
+                # reject quickly when the first character after a byte order mark and whitespace cannot start XML
+                chunk = file_handle.read(XmlHandler._sniff_size)
+                leading_content = chunk.lstrip('\ufeff \t\r\n')
+                if leading_content and not leading_content.startswith('<'):
+                    return False
+
+                while chunk:
+                    parser.feed(chunk)
+                    chunk = file_handle.read(XmlHandler._read_size)
+                parser.close()
             is_xml_format = True
-        except xml_element_tree_implementation.ParseError:
+        except (xml_element_tree_implementation.ParseError, defusedxml_implementation.DefusedXmlException,
+                UnicodeDecodeError):
             is_xml_format = False
 
         return is_xml_format
 
+    @staticmethod
+    def _advise_sequential_read(file_handle) -> None:
+        """
+        Hint the kernel that the file is read sequentially, so it reads ahead aggressively.
+
+        :param file_handle: file object, opened file
+        """
+
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(file_handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clear the cached results of is_xml_format.
+        """
+
+        XmlHandler._is_xml_format_cached.cache_clear()
+
     @staticmethod
     def read_xml_to_dict(file_path: str) -> dict:
         """
@@ -94,17 +223,126 @@ class XmlHandler:
         :raises ValueError: If the XML content cannot be parsed.
         """
 
-        if not os.path.isfile(file_path):
+        try:
+            file_handle = open(file_path, 'rb')
+        except (FileNotFoundError, IsADirectoryError):
             raise FileNotFoundError('file not found')
 
-        if not XmlHandler.is_xml_format(file_path):
-            raise TypeError('file not in XML format')
-
+        # a single parse, a document that is not well-formed is reported by expat
         try:
-            with open(file_path, 'r') as file_handle:
-                xml_content = file_handle.read()
-                xml_dict = xmltodict_implementation.parse(xml_content)
+            with file_handle:
+                xml_dict = xmltodict_implementation.parse(file_handle)
+        except xml_expat_implementation.ExpatError:
+            raise TypeError('file not in XML format')
         except Exception as e:
             raise ValueError(f"Failed to parse XML content: {e}")
 
         return xml_dict
+
+    @staticmethod
+    def iter_xml_items(path_or_file) -> Iterator[tuple]:
+        """
+        Iterate over the children of the root element of an Extensible Markup Language (XML) file.
+
+        The file is parsed incrementally and each child is released once it has been yielded,
+        so memory use is bounded by the largest child rather than by the whole document.
+        Documents declaring entities or referencing external resources are rejected.
+
+        :param path_or_file: str, os.PathLike or binary file object, path to the file or the opened file.
+            An opened file is read from its current position and is not closed.
+        :return: Iterator[tuple], (root tag, child tag, child item) for each child of the root element.
+            The child item has the same form as the corresponding value of read_xml_to_dict.
+            As in read_xml_to_dict, each attribute of the root element is yielded first with an '@' prefixed tag,
+            and text of the root element outside its children is yielded last with the '#text' tag.
+
+        :raises FileNotFoundError: If the file is not found.
+        :raises TypeError: If the file is not XML format or declares entities.
+        """
+
+        if isinstance(path_or_file, (str, os.PathLike)):
+            try:
+                file_context = open(path_or_file, 'rb')
+            except (FileNotFoundError, IsADirectoryError):
+                raise FileNotFoundError('file not found')
+            XmlHandler._advise_sequential_read(file_context)
+        else:
+            file_context = contextlib.nullcontext(path_or_file)
+
+        depth = 0
+        root = None
+        previous_child = None
+        root_texts = []
+
+        with file_context as file_handle:
+            try:
+                # entity declarations are rejected and external resources are never fetched
+                for event, element in defusedxml_element_tree_implementation.iterparse(file_handle,
+                                                                                        events=('start', 'end')):
+                    if event == 'start':
+                        if root is None:
+                            root = element
+                            for key, value in root.attrib.items():
+                                yield root.tag, f'@{key}', value
+                        elif depth == 1:
+                            # the root text before this child is complete, the root is cleared of it below
+                            XmlHandler._append_root_texts(root_texts, root, previous_child)
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 1:
+                            yield root.tag, element.tag, XmlHandler._convert_element_to_item(element)
+                            previous_child = element
+                            root.clear()  # all children of the root seen so far are complete
+                        elif depth == 0:
+                            XmlHandler._append_root_texts(root_texts, root, previous_child)
+                            if root_texts:
+                                yield root.tag, '#text', ''.join(root_texts)
+            except (xml_element_tree_implementation.ParseError, defusedxml_implementation.DefusedXmlException):
+                raise TypeError('file not in XML format')
+
+    @staticmethod
+    def _append_root_texts(root_texts: list, root: xml_element_tree_implementation.Element,
+                           previous_child: xml_element_tree_implementation.Element) -> None:
+        """
+        Append the text of the root element before its first child and after the previous child,
+        stripped of surrounding whitespace, to the texts collected so far.
+
+        :param root_texts: list, texts of the root element collected so far
+        :param root: Element, root element, its text is None once it has been cleared
+        :param previous_child: Element, child of the root element yielded last, or None
+        """
+
+        texts = [root.text]
+        if previous_child is not None:
+            texts.append(previous_child.tail)
+
+        root_texts.extend(text.strip() for text in texts if text and not text.isspace())
+
+    @staticmethod
+    def _convert_element_to_item(element: xml_element_tree_implementation.Element):
+        """
+        Convert an XML element to the item xmltodict would produce for it.
+
+        :param element: Element, complete XML element
+        :return: str, dict or None, stripped text for a leaf element, None for an empty leaf element,
+            otherwise a dictionary of attributes ('@' prefix), children and text ('#text').
+        """
+
+        text = element.text.strip() if element.text else ''
+
+        if len(element) == 0 and not element.attrib:
+            return text or None
+
+        item = {f'@{key}': value for key, value in element.attrib.items()}
+        for child in element:
+            child_item = XmlHandler._convert_element_to_item(child)
+            if child.tag not in item:
+                item[child.tag] = child_item
+            elif isinstance(item[child.tag], list):
+                item[child.tag].append(child_item)
+            else:
+                item[child.tag] = [item[child.tag], child_item]
+        if text:
+            item['#text'] = text
+
+        return item
@@ -4,9 +4,16 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
+import functools
+import hashlib
+import io
+import itertools
+import mmap
 import os
-from hashlib import md5, sha256, sha512, sha3_512
+import stat
+import xxhash as xxhash_implementation
 
 
 class HashType(Enum):
@@ -20,12 +27,14 @@ class HashType(Enum):
         HASH_TYPE_SHA256: Represents the SHA256 hash type.
         HASH_TYPE_SHA512: Represents the SHA512 hash type.
         HASH_TYPE_SHA3_512: Represents the SHA3_512 hash type.
+        HASH_TYPE_XXH3_128: Represents the XXH3 128-bit hash type, a fast non-cryptographic content fingerprint.
     """
 
     HASH_TYPE_MD5 = 'MD5'
     HASH_TYPE_SHA256 = 'SHA256'
     HASH_TYPE_SHA512= 'SHA512'
     HASH_TYPE_SHA3_512 = 'SHA3_512'
+    HASH_TYPE_XXH3_128 = 'XXH3_128'
 
 
 class HashService:
@@ -33,13 +42,25 @@ class HashService:
     A class to generate hash values.
     """
 
+    # the hashes are content checksums, not used for security, which keeps them available under FIPS
+    # and makes hashlib prefer the OpenSSL implementation
     _hash_type_encoder_map = {
-        HashType.HASH_TYPE_MD5: md5,
-        HashType.HASH_TYPE_SHA256: sha256,
-        HashType.HASH_TYPE_SHA512: sha512,
-        HashType.HASH_TYPE_SHA3_512: sha3_512
+        HashType.HASH_TYPE_MD5: functools.partial(hashlib.new, 'md5', usedforsecurity=False),
+        HashType.HASH_TYPE_SHA256: functools.partial(hashlib.new, 'sha256', usedforsecurity=False),
+        HashType.HASH_TYPE_SHA512: functools.partial(hashlib.new, 'sha512', usedforsecurity=False),
+        HashType.HASH_TYPE_SHA3_512: functools.partial(hashlib.new, 'sha3_512', usedforsecurity=False),
+        HashType.HASH_TYPE_XXH3_128: xxhash_implementation.xxh3_128
     }
 
+    # new encoders are copied from a fresh encoder of each hash type, which skips the algorithm lookup
+    # and initialization of the constructor. The prototypes are never updated, so copying them is thread-safe.
+    _hash_type_prototype_map = {hash_type: hash_encoder_factory()
+                                for hash_type, hash_encoder_factory in _hash_type_encoder_map.items()}
+
+    _mmap_threshold_size = 1 << 20  # files of at least 1 MiB are memory mapped
+    _mmap_single_update_size = 1 << 26  # larger maps are fed to several encoders in buffer sized slices
+    _minimum_default_buffer_size = 1 << 20  # the default buffer is the file system block size, at least 1 MiB
+
     @staticmethod
     def is_hash_type_allowed(hash_type: HashType) -> bool:
         """
@@ -63,22 +84,23 @@ class HashService:
         :raises ValueError: if the hash type does not match a supported encoder
         """
 
-        is_encoder_available = HashService.is_hash_type_allowed(hash_type)
-        if not is_encoder_available:
+        hash_encoder_prototype = HashService._hash_type_prototype_map.get(hash_type)
+        if hash_encoder_prototype is None:
             raise ValueError('hash type must be an allowed value')
 
-        hash_encoder = HashService._hash_type_encoder_map[hash_type]()
-
-        return hash_encoder
+        return hash_encoder_prototype.copy()
 
     @staticmethod
-    def calculate_file_hash(file_path: str, hash_type: HashType, file_buffer_size: int=65536) -> str:
+    def calculate_file_hash(file_path: str, hash_type: HashType, file_buffer_size: int=None) -> str:
         """
         Calculate the hash for the given file.
 
+        Files of at least 1 MiB are memory mapped and hashed in one update, smaller files are read in blocks.
+
         :param file_path: str, path to the file
         :param hash_type: HashType, hash type category such as MD5 or SHA256
-        :param file_buffer_size: int, size of the file buffer for block encoding, 65536 default
+        :param file_buffer_size: int, size of the file buffer for block encoding.
+            If None, the preferred block size of the file system, at least 1048576 (1 MiB), None default
         :return: str, hash value as a hexadecimal hash key
 
         :raises ValueError: if the file buffer size is invalid
@@ -86,32 +108,216 @@ class HashService:
         :raises FileNotFoundError: If the file is not found.
         """
 
-        if file_buffer_size <= 0:
+        return HashService.calculate_file_hashes(file_path, [hash_type], file_buffer_size)[hash_type]
+
+    @staticmethod
+    def calculate_file_hashes(file_path: str, hash_types: list, file_buffer_size: int=None) -> dict:
+        """
+        Calculate several hashes for the given file, reading the file only once.
+
+        :param file_path: str, path to the file
+        :param hash_types: list, hash type categories HashType such as MD5 or SHA256
+        :param file_buffer_size: int, size of the file buffer for block encoding.
+            If None, the preferred block size of the file system, at least 1048576 (1 MiB), None default
+        :return: dict, hash value as a hexadecimal hash key for each hash type, in the order of the hash types
+
+        :raises ValueError: if the file buffer size is invalid
+        :raises ValueError: if a hash type does not match a supported encoder
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        if file_buffer_size is not None and file_buffer_size <= 0:
             raise ValueError('buffer size must be positive')
 
-        is_encoder_available = HashService.is_hash_type_allowed(hash_type)
-        if not is_encoder_available:
+        hash_types = list(dict.fromkeys(hash_types))  # each hash type once, in order
+        hash_encoders = []
+        for hash_type in hash_types:
+            hash_encoder_prototype = HashService._hash_type_prototype_map.get(hash_type)
+            if hash_encoder_prototype is None:
+                raise ValueError('hash type must be an allowed value')
+            hash_encoders.append(hash_encoder_prototype.copy())
+
+        HashService._update_encoders_from_file(file_path, hash_encoders, file_buffer_size)
+
+        hash_values = {hash_type: hash_encoder.hexdigest() for hash_type, hash_encoder in zip(hash_types, hash_encoders)}
+
+        return hash_values
+
+    @staticmethod
+    def calculate_file_hash_batch(file_paths: list, hash_type: HashType, max_workers: int=None,
+                                  use_threads: bool=False) -> dict:
+        """
+        Calculate the hash for many files, hashing the files in parallel worker processes or threads.
+
+        Worker threads suit I/O bound batches such as files not in the page cache: the reads and the hash encoders
+        release the GIL, so the reads of many files are in flight at once and no paths or results are pickled.
+        Worker processes suit CPU bound batches of cached files.
+
+        :param file_paths: list, paths to the files
+        :param hash_type: HashType, hash type category such as MD5 or SHA256
+        :param max_workers: int, maximum number of workers, executor default if None
+        :param use_threads: bool, True to hash in worker threads, False to hash in worker processes, False default
+        :return: dict, hash value as a hexadecimal hash key for each file path, in the order of the paths
+
+        :raises ValueError: if the maximum number of workers is not positive
+        :raises ValueError: if the hash type does not match a supported encoder
+        :raises FileNotFoundError: If a file is not found.
+        """
+
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError('maximum number of workers must be positive')
+
+        if not HashService.is_hash_type_allowed(hash_type):
             raise ValueError('hash type must be an allowed value')
 
-        is_file_found = os.path.isfile(file_path)
-        if not is_file_found:
+        file_paths = list(file_paths)
+        if len(file_paths) <= 1 or max_workers == 1:
+            hash_values = [HashService.calculate_file_hash(file_path, hash_type) for file_path in file_paths]
+        elif use_threads:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                hash_values = list(executor.map(HashService.calculate_file_hash, file_paths,
+                                                itertools.repeat(hash_type)))
+        else:
+            # several paths per task amortize the inter-process communication
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                hash_values = list(executor.map(HashService.calculate_file_hash, file_paths,
+                                                itertools.repeat(hash_type), chunksize=16))
+
+        return dict(zip(file_paths, hash_values))
+
+    @staticmethod
+    def _update_encoders_from_file(file_path: str, hash_encoders: list, file_buffer_size: int) -> None:
+        """
+        Update all hash encoders with the content of the file, in a single pass over the file.
+
+        :param file_path: str, path to the file
+        :param hash_encoders: list, instances of the hash encoders
+        :param file_buffer_size: int, size of the file buffer for block encoding, or None for the default size
+
+        :raises FileNotFoundError: If the file is not found or is not a regular file.
+        """
+
+        # non-blocking, so opening a FIFO without a writer returns at once and is rejected as not a regular file
+        open_flags = os.O_RDONLY | getattr(os, 'O_NONBLOCK', 0) | getattr(os, 'O_BINARY', 0)
+        try:
+            file_descriptor = os.open(file_path, open_flags)
+        except (FileNotFoundError, IsADirectoryError):
             raise FileNotFoundError('file not found')
 
-        hash_encoder = HashService._get_hash_encoder_instance(hash_type)
+        file_stat = os.fstat(file_descriptor)
+        if not stat.S_ISREG(file_stat.st_mode):
+            os.close(file_descriptor)
+            raise FileNotFoundError('file not found')
 
-        with open(file_path, 'rb') as file_handle:
-            is_reading = True
-            while is_reading:
-                buffer = file_handle.read(file_buffer_size)
+        # unbuffered, the blocks go straight from the file into the encoders without an intermediate copy
+        with io.FileIO(file_descriptor, 'r') as file_handle:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(file_handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)  # read ahead aggressively
+
+            # large files are hashed straight from a memory map, without copying the blocks into bytes objects
+            file_size = file_stat.st_size
+            is_large_file = file_size >= HashService._mmap_threshold_size
+
+            if file_buffer_size is None:
+                file_buffer_size = HashService._get_default_buffer_size(file_stat)
+            file_map = None
+            if is_large_file:
+                # only mapping the file may fail over to block reads, the encoders have not been updated yet
+                try:
+                    file_map = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    file_map = None  # the file cannot be memory mapped, read it in blocks
+
+            if file_map is not None:
+                with file_map:
+                    HashService._update_encoders_from_map(file_map, hash_encoders, file_buffer_size)
+            else:
+                # one buffer is read into again and again, no bytes object is allocated per block.
+                # A buffer beyond the file size reads the whole file at once and allocates no more than needed.
+                # Files reporting no size, such as procfs and sysfs files, may still hold content of any length.
+                if file_size > 0:
+                    file_buffer_size = min(file_buffer_size, file_size + 1)
+                buffer = bytearray(file_buffer_size)
+                with memoryview(buffer) as buffer_view:
+                    while True:
+                        n_bytes_read = file_handle.readinto(buffer)
+                        if not n_bytes_read:
+                            break
+
+                        with buffer_view[:n_bytes_read] as block_view:
+                            for hash_encoder in hash_encoders:
+                                hash_encoder.update(block_view)
 
-                if not buffer:
-                    is_reading = False
-                else:
-                    hash_encoder.update(buffer)
+    @staticmethod
+    def _get_default_buffer_size(file_stat: os.stat_result) -> int:
+        """
+        Get the default size of the file buffer for block encoding.
+
+        :param file_stat: os.stat_result, status of the opened file
+        :return: int, preferred block size of the file system, at least 1 MiB.
+            Where the block size is not reported, 1 MiB.
+        """
 
-            hash_value = hash_encoder.hexdigest()
+        block_size = getattr(file_stat, 'st_blksize', 0)
 
-        return hash_value
+        return max(block_size, HashService._minimum_default_buffer_size)
+
+    @staticmethod
+    def _update_encoders_from_map(file_map: mmap.mmap, hash_encoders: list, file_buffer_size: int) -> None:
+        """
+        Update all hash encoders with the content of a memory mapped file.
+
+        A single encoder is updated with the whole map in one call. Several encoders are updated in parallel
+        worker threads, one per encoder, as the hash encoders release the GIL while hashing. A map up to 64 MiB
+        is passed whole to each encoder, larger maps are passed in zero-copy slices of the buffer size, so
+        each slice is hashed by all encoders while its pages are still cached instead of faulting the whole
+        file in once per encoder.
+
+        :param file_map: mmap, memory map of the file
+        :param hash_encoders: list, instances of the hash encoders
+        :param file_buffer_size: int, size of the slices for several encoders of a large map
+        """
+
+        if hasattr(file_map, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            file_map.madvise(mmap.MADV_SEQUENTIAL)
+
+        if len(hash_encoders) <= 1:
+            for hash_encoder in hash_encoders:
+                hash_encoder.update(file_map)
+            return
+
+        def update_encoders(executor, buffer):
+            for update in [executor.submit(hash_encoder.update, buffer) for hash_encoder in hash_encoders]:
+                update.result()
+
+        with ThreadPoolExecutor(max_workers=len(hash_encoders)) as executor:
+            if len(file_map) <= HashService._mmap_single_update_size:
+                update_encoders(executor, file_map)
+                return
+
+            with memoryview(file_map) as file_view:
+                for offset in range(0, len(file_view), file_buffer_size):
+                    with file_view[offset:offset + file_buffer_size] as slice_view:
+                        update_encoders(executor, slice_view)
+
+    @staticmethod
+    def calculate_content_fingerprint(buffer_or_path) -> str:
+        """
+        Calculate a fast content fingerprint for a binary buffer or a file, to detect identical content.
+
+        The fingerprint is the non-cryptographic XXH3 128-bit hash. It is suited to deduplication and cache keys,
+        but not to integrity checks against tampering, where a cryptographic hash such as SHA256 is required.
+
+        :param buffer_or_path: bytes-like, str or os.PathLike, binary buffer or path to the file
+        :return: str, fingerprint as a hexadecimal hash key
+
+        :raises FileNotFoundError: If the file is not found.
+        """
+
+        if isinstance(buffer_or_path, (str, os.PathLike)):
+            return HashService.calculate_file_hash(buffer_or_path, HashType.HASH_TYPE_XXH3_128)
+
+        return HashService.calculate_buffer_hash(buffer_or_path, HashType.HASH_TYPE_XXH3_128)
 
     @staticmethod
     def calculate_buffer_hash(buffer: bytes, hash_type: HashType) -> str:
@@ -125,11 +331,6 @@ class HashService:
         :raises ValueError: if the hash type does not match a supported encoder
         """
 
-        is_encoder_available = HashService.is_hash_type_allowed(hash_type)
-
-        if not is_encoder_available:
-            raise ValueError('hash type must be an allowed value')
-
         hash_encoder = HashService._get_hash_encoder_instance(hash_type)
         hash_encoder.update(buffer)
         hash_value = hash_encoder.hexdigest()
@@ -0,0 +1,46 @@
+# File: test_file_entry.py
+# Description: Unit tests for the arXiv manifest FileEntry class.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+import dataclasses
+import pytest
+
+from feck.arxiv.file_entry import FileEntry
+
+
+@pytest.fixture
+def file_entry():
+    """
+    Fixture to provide a FileEntry.
+    """
+    return FileEntry(filename='src/arXiv_src_1508_002.tar', size_bytes=537749445,
+                     timestamp_iso='2017-08-05T10:13:16+00:00', year=2015, month=8, sequence_number=2,
+                     n_submissions=438, md5='271195f030a45b84d397dc8c540bde7f',
+                     md5_contents='5f4774a944c17e67f334ebb9bf912dbf')
+
+def test_file_entry_fields(file_entry):
+    """
+    Test the fields of a FileEntry.
+    """
+    assert file_entry.filename == 'src/arXiv_src_1508_002.tar'
+    assert file_entry.year == 2015
+    assert file_entry.month == 8
+    assert [field.name for field in dataclasses.fields(FileEntry)] == [
+        'filename', 'size_bytes', 'timestamp_iso', 'year', 'month', 'sequence_number', 'n_submissions',
+        'md5', 'md5_contents'
+    ]
+
+def test_file_entry_frozen(file_entry):
+    """
+    Test that a FileEntry cannot be modified.
+    """
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        file_entry.year = 2016
+
+def test_file_entry_slots(file_entry):
+    """
+    Test that a FileEntry has slots and no instance dictionary.
+    """
+    assert not hasattr(file_entry, '__dict__')
@@ -5,12 +5,17 @@
 # Licensed under the MIT License. See the LICENSE file for more details.
 
 import copy
+import hashlib
+import io
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 import pytest
 import tempfile
 
+from feck.arxiv.file_entry import FileEntry
 from feck.arxiv.manifest import Manifest
+from feck.file.hash_service import HashService
 
 # Sample valid xml_dict
 valid_xml_dict = {
@@ -33,16 +38,33 @@ valid_xml_dict = {
     }
 }
 
+def _copy_with_override(path, value, xml_dict=valid_xml_dict):
+    """
+    Copy an xml_dict with the value at a key path replaced.
+
+    Only the dictionaries along the path are copied, all other subtrees are shared with the original,
+    so the original must not be mutated through the copy.
+    """
+    if not path:
+        return value
+    return dict(xml_dict, **{path[0]: _copy_with_override(path[1:], value, xml_dict[path[0]])})
+
+def assert_default_manifest(manifest):
+    """
+    Assert that the manifest holds default values: no metadata and empty content columns.
+    """
+    assert manifest._manifest['metadata'] == {}
+    assert set(manifest._manifest['contents'].keys()) == {'filename', 'size_bytes', 'timestamp_iso', 'year', 'month',
+                                                          'sequence_number', 'n_submissions', 'md5', 'md5_contents'}
+    assert all(len(column) == 0 for column in manifest._manifest['contents'].values())
+
 def test_manifest_constructor():
     """
     Test the constructor of the Manifest class.
     Ensure that the manifest is initialized with default values.
     """
     manifest = Manifest()
-    assert manifest._manifest == {
-        'metadata': {},
-        'contents': []
-    }
+    assert_default_manifest(manifest)
 
 def test_manifest_clear():
     """
@@ -52,16 +74,13 @@ def test_manifest_clear():
     manifest = Manifest()
     # Modify the manifest to simulate existing data
     manifest._manifest['metadata'] = {'key': 'value'}
-    manifest._manifest['contents'] = [{'filename': 'test.txt'}]
+    manifest._manifest['contents']['filename'] = ['test.txt']
 
     # Call the clear method
     manifest.clear()
 
     # Assert that the manifest is reset to default values
-    assert manifest._manifest == {
-        'metadata': {},
-        'contents': []
-    }
+    assert_default_manifest(manifest)
 
 def test_manifest_set_defaults():
     """
@@ -71,16 +90,13 @@ def test_manifest_set_defaults():
     manifest = Manifest()
     # Modify the manifest to simulate existing data
     manifest._manifest['metadata'] = {'key': 'value'}
-    manifest._manifest['contents'] = [{'filename': 'test.txt'}]
+    manifest._manifest['contents']['filename'] = ['test.txt']
 
     # Call the _set_defaults method
     manifest._set_defaults()
 
     # Assert that the manifest is reset to default values
-    assert manifest._manifest == {
-        'metadata': {},
-        'contents': []
-    }
+    assert_default_manifest(manifest)
 
 def test_is_arxiv_keys_present_with_valid_data():
     """
@@ -88,6 +104,18 @@ def test_is_arxiv_keys_present_with_valid_data():
     """
     assert Manifest._is_arxiv_keys_present(valid_xml_dict) is True
 
+def test_copy_with_override():
+    """
+    Test that _copy_with_override replaces the value at the path and leaves the original unchanged.
+    """
+    original = copy.deepcopy(valid_xml_dict)
+
+    overridden = _copy_with_override(('arXivSRC', 'timestamp'), 'other')
+
+    assert overridden['arXivSRC']['timestamp'] == 'other'
+    assert overridden['arXivSRC']['file'] is valid_xml_dict['arXivSRC']['file']
+    assert valid_xml_dict == original
+
 def test_is_arxiv_keys_present_with_missing_top_level_key():
     """
     Test that the method returns False when the top-level key is missing.
@@ -100,13 +128,13 @@ def test_is_arxiv_keys_present_with_missing_arxivsrc_keys():
     Test that the method returns False when 'arXivSRC' keys are missing.
     """
 
-    invalid_dict = copy.deepcopy(valid_xml_dict)
-    del invalid_dict['arXivSRC']['file']
+    invalid_dict = _copy_with_override(('arXivSRC',), {key: value for key, value in valid_xml_dict['arXivSRC'].items()
+                                                        if key != 'file'})
 
     assert Manifest._is_arxiv_keys_present(invalid_dict) is False
 
-    invalid_dict = copy.deepcopy(valid_xml_dict)
-    del invalid_dict['arXivSRC']['timestamp']
+    invalid_dict = _copy_with_override(('arXivSRC',), {key: value for key, value in valid_xml_dict['arXivSRC'].items()
+                                                        if key != 'timestamp'})
 
     assert Manifest._is_arxiv_keys_present(invalid_dict) is False
 
@@ -115,8 +143,7 @@ def test_is_arxiv_keys_valid_with_non_string_value_in_timestamp():
     """
     Test that the method returns False when a value in 'file' is not a string.
     """
-    invalid_dict = copy.deepcopy(valid_xml_dict)
-    invalid_dict['arXivSRC']['timestamp'] = 1234  # should be a string
+    invalid_dict = _copy_with_override(('arXivSRC', 'timestamp'), 1234)  # should be a string
 
     assert Manifest._is_arxiv_keys_present(invalid_dict) is False
 
@@ -196,6 +223,62 @@ def test_convert_arxiv_file_entry_timestamp_to_iso():
     assert result == expected_output
 
 
+@pytest.mark.parametrize("input_timestamp, expected_output", [
+    ('Mon Apr  7 04:58:03 2025', '2025-04-07T08:58:03+00:00'),  # daylight saving time
+    ('Fri Dec 31 23:59:59 2010', '2011-01-01T04:59:59+00:00'),  # standard time, year rollover
+    ('Sat Feb 29 12:00:00 2020', '2020-02-29T17:00:00+00:00'),  # leap day
+])
+def test_convert_arxiv_timestamp_to_iso_months(input_timestamp, expected_output):
+    """
+    Test _convert_arxiv_timestamp_to_iso across month names and time zone offsets.
+    """
+    assert Manifest._convert_arxiv_timestamp_to_iso(input_timestamp) == expected_output
+
+
+def test_convert_arxiv_file_entry_timestamp_to_iso_cached():
+    """
+    Test that _convert_arxiv_file_entry_timestamp_to_iso converts a repeated timestamp only once.
+    """
+    Manifest._convert_arxiv_file_entry_timestamp_to_iso.cache_clear()
+
+    for _ in range(3):
+        assert Manifest._convert_arxiv_file_entry_timestamp_to_iso('2010-12-23 00:13:59') == '2010-12-23T05:13:59+00:00'
+
+    cache_info = Manifest._convert_arxiv_file_entry_timestamp_to_iso.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 1)
+
+
+@pytest.mark.parametrize("input_timestamp", [
+    'Mon Abc  7 04:58:03 2025',  # unknown month
+    'Xyz Apr  7 04:58:03 2025',  # unknown weekday
+    'Mon Apr  7 04:58 2025',     # missing seconds
+    'Mon Apr 31 04:58:03 2025',  # day out of range
+])
+def test_convert_arxiv_timestamp_to_iso_invalid_fields(input_timestamp):
+    """
+    Test _convert_arxiv_timestamp_to_iso with malformed fields.
+    """
+    with pytest.raises(ValueError):
+        Manifest._convert_arxiv_timestamp_to_iso(input_timestamp)
+
+
+@pytest.mark.parametrize("input_timestamp", [
+    '2010-12-23 00:13',       # too short
+    '2010-13-23 00:13:59',    # month out of range
+    '2010-12-23 00:13:59.0',  # too long
+    '2010/12/23 00:13:59',    # wrong date separators
+    '2010-12-23T00:13:59',    # wrong date and time separator
+    '2010-12-23 00.13.59',    # wrong time separators
+    '2010-1-023 00:13:59',    # misplaced separator
+])
+def test_convert_arxiv_file_entry_timestamp_to_iso_invalid_fields(input_timestamp):
+    """
+    Test _convert_arxiv_file_entry_timestamp_to_iso with malformed fields.
+    """
+    with pytest.raises(ValueError):
+        Manifest._convert_arxiv_file_entry_timestamp_to_iso(input_timestamp)
+
+
 def test_convert_arxiv_timestamp_to_iso_invalid_format():
     """
     Test _convert_arxiv_timestamp_to_iso method with an invalid timestamp format.
@@ -220,6 +303,29 @@ def test_convert_arxiv_file_entry_timestamp_to_iso_invalid_format():
         Manifest._convert_arxiv_file_entry_timestamp_to_iso(input_timestamp)
 
 
+@pytest.mark.parametrize("changes, expected_is_valid", [
+    ({}, True),
+    ({'extra': 'value'}, False),                  # additional key
+    ({'yymm': None}, False),                       # value not a string
+    ({'yymm': {'#text': '0001'}}, False),          # nested value
+])
+def test_is_file_entry_keys_present(changes, expected_is_valid):
+    """
+    Test _is_file_entry_keys_present with variations of the keys and values of a file entry.
+    """
+    entry = dict(valid_xml_dict['arXivSRC']['file'][0], **changes)
+    assert Manifest._is_file_entry_keys_present(entry) is expected_is_valid
+
+def test_is_file_entry_keys_present_replaced_key():
+    """
+    Test _is_file_entry_keys_present with a required key replaced by another key, so the number of keys is unchanged.
+    """
+    entry = dict(valid_xml_dict['arXivSRC']['file'][0])
+    entry['yymm_replaced'] = entry.pop('yymm')
+
+    assert Manifest._is_file_entry_keys_present(entry) is False
+    assert Manifest._is_file_entry_keys_present([entry]) is False
+
 def test_is_file_entry_consistent_valid_entry():
     """
     Test _is_file_entry_consistent with a valid file entry.
@@ -293,6 +399,65 @@ def test_is_file_entry_consistent_invalid_seq_num():
     }
     assert Manifest._is_file_entry_consistent(invalid_entry) is False
 
+@pytest.mark.parametrize("filename, yymm, seq_num, expected_is_consistent", [
+    ('src/arXiv_src_1508_002.tar', '1508', '2', True),
+    ('src/arXiv_src_1508_1002.tar', '1508', '1002', True),    # sequence number beyond three digits
+    ('src/arXiv_src_1508_0002.tar', '1508', '2', False),      # too much zero padding
+    ('src/arXiv_src_1508_02.tar', '1508', '2', False),        # too little zero padding
+    ('src/arXiv_src_1509_002.tar', '1508', '2', False),       # yymm mismatch
+    ('src/arXiv_src_1508_002.tar.gz', '1508', '2', False),    # trailing characters
+    ('src/arXiv_src_1500_002.tar', '1500', '2', False),       # month zero
+])
+def test_is_file_entry_consistent_filename_pattern(filename, yymm, seq_num, expected_is_consistent):
+    """
+    Test _is_file_entry_consistent against variations of the filename pattern.
+    """
+    entry = {
+        'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
+        'filename': filename,
+        'first_item': '1508.00577',
+        'last_item': '1508.01014',
+        'md5sum': '271195f030a45b84d397dc8c540bde7f',
+        'num_items': '438',
+        'seq_num': seq_num,
+        'size': '537749445',
+        'timestamp': '2017-08-05 06:13:16',
+        'yymm': yymm
+    }
+    assert Manifest._is_file_entry_consistent(entry) is expected_is_consistent
+
+@pytest.mark.parametrize("filename, yymm, seq_num", [
+    ('src/arXiv_src_1508_002.tar', '1508', '2'),
+    ('src/arXiv_src_1508_1002.tar', '1508', '1002'),
+    ('src/arXiv_src_1508_0002.tar', '1508', '2'),
+    ('src/arXiv_src_1508_02.tar', '1508', '2'),
+    ('src/arXiv_src_1509_002.tar', '1508', '2'),
+    ('src/arXiv_src_1508_002.tar.gz', '1508', '2'),
+    ('src/arXiv_src_1500_002.tar', '1500', '2'),
+    ('src/arXiv_src_1513_002.tar', '1513', '2'),              # month out of range
+    ('src/arXiv_src_1508_-02.tar', '1508', '-2'),             # negative sequence number
+    ('src/arXiv_src_15a8_002.tar', '15a8', '2'),              # non-digit yymm
+    ('src/arXiv_src_15080_002.tar', '15080', '2'),            # falls back to the per-entry check
+])
+def test_are_file_entries_consistent_matches_per_entry_check(filename, yymm, seq_num):
+    """
+    Test that _are_file_entries_consistent agrees with _is_file_entry_consistent for each entry.
+    """
+    valid_entry = copy.copy(valid_xml_dict['arXivSRC']['file'][0])
+    entry = dict(valid_entry, filename=filename, yymm=yymm, seq_num=seq_num)
+    entries = [valid_entry, entry, valid_entry]
+
+    is_consistent = Manifest._are_file_entries_consistent(entries)
+
+    assert is_consistent.dtype == bool
+    assert is_consistent.tolist() == [True, Manifest._is_file_entry_consistent(entry), True]
+
+def test_are_file_entries_consistent_empty():
+    """
+    Test _are_file_entries_consistent with no file entries.
+    """
+    assert Manifest._are_file_entries_consistent([]).tolist() == []
+
 def test_process_file_entry_valid():
     """
     Test _process_file_entry with a valid file entry.
@@ -312,19 +477,72 @@ def test_process_file_entry_valid():
 
     processed_entry = Manifest._process_file_entry(valid_entry)
 
-    assert processed_entry == {
-        'filename': 'src/arXiv_src_1508_002.tar',
-        'size_bytes': 537749445,
-        'timestamp_iso': '2017-08-05T10:13:16+00:00',
-        'year': 2015,
-        'month': 8,
-        'sequence_number': 2,
-        'n_submissions': 438,
-        'hash': {
-            'MD5': '271195f030a45b84d397dc8c540bde7f',
-            'MD5_contents': '5f4774a944c17e67f334ebb9bf912dbf',
-        }
-    }
+    assert processed_entry == FileEntry(
+        filename='src/arXiv_src_1508_002.tar',
+        size_bytes=537749445,
+        timestamp_iso='2017-08-05T10:13:16+00:00',
+        year=2015,
+        month=8,
+        sequence_number=2,
+        n_submissions=438,
+        md5='271195f030a45b84d397dc8c540bde7f',
+        md5_contents='5f4774a944c17e67f334ebb9bf912dbf'
+    )
+    assert type(processed_entry.size_bytes) is int
+
+def test_process_file_entries_valid():
+    """
+    Test _process_file_entries with several valid file entries, spanning both centuries.
+    """
+    entries = [
+        {
+            'content_md5sum': '5f4774a944c17e67f334ebb9bf912dbf',
+            'filename': 'src/arXiv_src_9912_001.tar',
+            'first_item': 'astro-ph9912001',
+            'last_item': 'quant-ph9912119',
+            'md5sum': '271195f030a45b84d397dc8c540bde7f',
+            'num_items': '1200',
+            'seq_num': '1',
+            'size': '125605507',
+            'timestamp': '2010-12-22 23:50:01',
+            'yymm': '9912'
+        },
+        copy.copy(valid_xml_dict['arXivSRC']['file'][0])
+    ]
+
+    contents = Manifest._process_file_entries(entries)
+
+    assert contents['filename'] == ['src/arXiv_src_9912_001.tar', 'src/arXiv_src_0001_001.tar']
+    assert contents['timestamp_iso'] == ['2010-12-23T04:50:01+00:00', '2010-12-23T05:13:59+00:00']
+    assert contents['year'].tolist() == [1999, 2000]
+    assert contents['month'].tolist() == [12, 1]
+    assert contents['sequence_number'].tolist() == [1, 1]
+    assert contents['size_bytes'].tolist() == [125605507, 225605507]
+    assert contents['n_submissions'].tolist() == [1200, 2364]
+    assert contents['md5'] == ['271195f030a45b84d397dc8c540bde7f', '949ae880fbaf4649a485a8d9e07f370b']
+    assert contents['md5_contents'] == ['5f4774a944c17e67f334ebb9bf912dbf', 'cacbfede21d5dfef26f367ec99384546']
+    assert contents['size_bytes'].dtype == np.int64
+
+@pytest.mark.parametrize("yymm, expected_year", [('9001', 2090), ('9101', 1991), ('0001', 2000)])
+def test_process_file_entries_century(yymm, expected_year):
+    """
+    Test the century of the year computed by _process_file_entries around the 90/91 boundary.
+    """
+    entry = dict(valid_xml_dict['arXivSRC']['file'][0], filename=f'src/arXiv_src_{yymm}_001.tar', yymm=yymm)
+
+    contents = Manifest._process_file_entries([entry])
+
+    assert contents['year'].dtype == np.int16
+    assert contents['year'].tolist() == [expected_year]
+
+def test_process_file_entries_empty():
+    """
+    Test _process_file_entries with no file entries.
+    """
+    contents = Manifest._process_file_entries([])
+
+    assert set(contents.keys()) == set(Manifest._get_empty_contents().keys())
+    assert all(len(column) == 0 for column in contents.values())
 
 def test_process_file_entry_inconsistent():
     """
@@ -366,10 +584,10 @@ def test_process_file_entry_invalid_yymm():
     with pytest.raises(ValueError, match="Entry inconsistent"):
         Manifest._process_file_entry(invalid_entry)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_xml_file():
     """
-    Create a temporary XML file with valid arXiv data for testing.
+    Create a temporary XML file with valid arXiv data for testing, shared by the tests of the module.
     """
     xml_content = """<arXivSRC>
         <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
@@ -415,9 +633,193 @@ def test_import_arxiv_xml_valid(valid_xml_file):
         'manifest_filename': os.path.basename(valid_xml_file),
         'timestamp_iso': '2025-04-07T08:58:03+00:00'
     }
-    assert len(manifest._manifest['contents']) == 2
-    assert manifest._manifest['contents'][0]['filename'] == 'src/arXiv_src_0001_001.tar'
-    assert manifest._manifest['contents'][1]['filename'] == 'src/arXiv_src_0002_001.tar'
+    assert manifest._manifest['contents']['filename'] == ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar']
+    assert manifest._manifest['contents']['year'].tolist() == [2000, 2000]
+    assert manifest._manifest['contents']['month'].tolist() == [1, 2]
+    assert manifest._manifest['contents']['size_bytes'].tolist() == [225605507, 227036528]
+
+def test_import_arxiv_xml_file_object(valid_xml_file):
+    """
+    Test import_arxiv_xml with an opened file object, named and unnamed.
+    """
+    with open(valid_xml_file, 'rb') as file_handle:
+        xml_bytes = file_handle.read()
+        file_handle.seek(0)
+        manifest = Manifest()
+        manifest.import_arxiv_xml(file_handle)
+        assert not file_handle.closed
+
+    assert manifest._manifest['metadata']['manifest_filename'] == os.path.basename(valid_xml_file)
+
+    manifest_from_bytes = Manifest()
+    manifest_from_bytes.import_arxiv_xml(io.BytesIO(xml_bytes))
+
+    assert manifest_from_bytes._manifest['metadata'] == {
+        'manifest_filename': None,
+        'timestamp_iso': '2025-04-07T08:58:03+00:00'
+    }
+    assert manifest_from_bytes._manifest['contents']['filename'] == manifest._manifest['contents']['filename']
+    assert manifest_from_bytes._manifest['contents']['md5'] == manifest._manifest['contents']['md5']
+
+def test_import_arxiv_xml_batches(valid_xml_file, monkeypatch):
+    """
+    Test import_arxiv_xml when the file entries span several processing batches.
+    """
+    monkeypatch.setattr('feck.arxiv.manifest._FILE_ENTRY_BATCH_SIZE', 1)
+
+    manifest = Manifest()
+    manifest.import_arxiv_xml(valid_xml_file)
+
+    assert manifest._manifest['contents']['filename'] == ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar']
+    assert manifest._manifest['contents']['n_submissions'].tolist() == [2364, 2365]
+
+def test_import_arxiv_xml_parallel_batches(valid_xml_file, monkeypatch):
+    """
+    Test import_arxiv_xml when the batches are processed by worker processes.
+    """
+    monkeypatch.setattr('feck.arxiv.manifest._FILE_ENTRY_BATCH_SIZE', 1)
+    monkeypatch.setattr('feck.arxiv.manifest._PARALLEL_BATCH_THRESHOLD', 0)
+
+    manifest = Manifest()
+    manifest.import_arxiv_xml(valid_xml_file, max_workers=2)
+
+    assert manifest._manifest['contents']['filename'] == ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar']
+    assert manifest._manifest['contents']['timestamp_iso'] == ['2010-12-23T05:13:59+00:00',
+                                                               '2010-12-23T05:18:09+00:00']
+
+def test_import_arxiv_xml_serial_default(valid_xml_file, monkeypatch, mocker):
+    """
+    Test that import_arxiv_xml starts no worker process unless several workers are requested.
+    """
+    monkeypatch.setattr('feck.arxiv.manifest._FILE_ENTRY_BATCH_SIZE', 1)
+    monkeypatch.setattr('feck.arxiv.manifest._PARALLEL_BATCH_THRESHOLD', 0)
+    mock_executor = mocker.patch('feck.arxiv.manifest.ProcessPoolExecutor')
+
+    manifest = Manifest()
+    manifest.import_arxiv_xml(valid_xml_file)
+    manifest.import_arxiv_xml(valid_xml_file, max_workers=1)
+
+    assert mock_executor.call_count == 0
+    assert manifest._manifest['contents']['filename'] == ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar']
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_import_arxiv_xml_invalid_max_workers(valid_xml_file, max_workers):
+    """
+    Test that import_arxiv_xml raises ValueError for a maximum number of workers that is not positive.
+    """
+    manifest = Manifest()
+
+    with pytest.raises(ValueError, match='maximum number of workers must be positive'):
+        manifest.import_arxiv_xml(valid_xml_file, max_workers=max_workers)
+
+def test_import_arxiv_xml_single_file_entry():
+    """
+    Test import_arxiv_xml with a manifest holding a single file entry.
+    """
+    xml_content = """<arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>src/arXiv_src_0001_001.tar</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>2364</num_items>
+            <seq_num>1</seq_num>
+            <size>225605507</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>
+    </arXivSRC>"""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
+        temp_file.write(xml_content.encode('utf-8'))
+        temp_file_path = temp_file.name
+
+    manifest = Manifest()
+
+    try:
+        manifest.import_arxiv_xml(temp_file_path)
+        assert manifest._manifest['contents']['filename'] == ['src/arXiv_src_0001_001.tar']
+    finally:
+        os.remove(temp_file_path)
+
+@pytest.mark.parametrize("xml_content", [
+    "<arXivSRC><timestamp>Mon Apr  7 04:58:03 2025</timestamp></arXivSRC>",                   # no file entries
+    "<arXivSRC><file><filename>src/arXiv_src_0001_001.tar</filename></file></arXivSRC>",      # missing file keys
+    "<other><timestamp>Mon Apr  7 04:58:03 2025</timestamp></other>",                         # wrong root
+    "<arXivSRC><timestamp>Mon Apr  7 04:58:03 2025</timestamp><extra>1</extra></arXivSRC>",   # unexpected entry
+])
+def test_import_arxiv_xml_missing_entries(xml_content):
+    """
+    Test import_arxiv_xml with XML files that miss required arXiv entries.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
+        temp_file.write(xml_content.encode('utf-8'))
+        temp_file_path = temp_file.name
+
+    manifest = Manifest()
+
+    try:
+        with pytest.raises(TypeError, match='Entries missing in arXiv XML file'):
+            manifest.import_arxiv_xml(temp_file_path)
+    finally:
+        os.remove(temp_file_path)
+
+@pytest.mark.parametrize("xml_content", [
+    """<arXivSRC version="2">
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>src/arXiv_src_0001_001.tar</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>2364</num_items>
+            <seq_num>1</seq_num>
+            <size>225605507</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>
+    </arXivSRC>""",                                                     # attribute on the root element
+    """<arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>src/arXiv_src_0001_001.tar</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>2364</num_items>
+            <seq_num>1</seq_num>
+            <size>225605507</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>
+        stray text
+    </arXivSRC>""",                                                     # text in the root element
+])
+def test_import_arxiv_xml_root_attribute_or_text(xml_content):
+    """
+    Test that import_arxiv_xml rejects a manifest whose root element holds attributes or text.
+    """
+    manifest = Manifest()
+
+    with pytest.raises(TypeError, match='Entries missing in arXiv XML file'):
+        manifest.import_arxiv_xml(io.BytesIO(xml_content.encode('utf-8')))
+
+def test_import_arxiv_xml_entity_expansion():
+    """
+    Test that import_arxiv_xml rejects a manifest declaring internal entities.
+    """
+    xml_content = """<!DOCTYPE arXivSRC [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">]>
+    <arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025 &b;</timestamp>
+    </arXivSRC>"""
+
+    manifest = Manifest()
+
+    with pytest.raises(TypeError, match='file not in XML format'):
+        manifest.import_arxiv_xml(io.BytesIO(xml_content.encode('utf-8')))
 
 def test_import_arxiv_xml_file_not_found():
     """
@@ -433,16 +835,11 @@ def test_import_arxiv_xml_invalid_structure():
     Test import_arxiv_xml with an invalid XML structure.
     """
     invalid_xml_content = """<invalid></invalid>"""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
-        temp_file.write(invalid_xml_content.encode('utf-8'))
-        temp_file_path = temp_file.name
 
     manifest = Manifest()
 
     with pytest.raises(TypeError, match='Entries missing in arXiv XML file'):
-        manifest.import_arxiv_xml(temp_file_path)
-
-    os.remove(temp_file_path)
+        manifest.import_arxiv_xml(io.BytesIO(invalid_xml_content.encode('utf-8')))
 
 def test_import_arxiv_xml_inconsistent_entry():
     """
@@ -475,21 +872,120 @@ def test_import_arxiv_xml_inconsistent_entry():
             <yymm>0001</yymm>
         </file>        
     </arXivSRC>"""
+
+    manifest = Manifest()
+
+    with pytest.raises(ValueError, match='Entry inconsistent'):
+        manifest.import_arxiv_xml(io.BytesIO(inconsistent_xml_content.encode('utf-8')))
+
+@pytest.mark.parametrize("filename, num_items, seq_num, size, key", [
+    ('src/arXiv_src_0001_001.tar', '2147483648', '1', '225605507', 'num_items'),
+    ('src/arXiv_src_0001_4294967296.tar', '2364', '4294967296', '225605507', 'seq_num'),
+    ('src/arXiv_src_0001_001.tar', '2364', '1', '99999999999999999999', 'size'),
+])
+def test_import_arxiv_xml_integer_out_of_range(filename, num_items, seq_num, size, key):
+    """
+    Test that an integer field out of range of its column raises ValueError naming the entry.
+    """
+    xml_content = f"""<arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>{filename}</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>{num_items}</num_items>
+            <seq_num>{seq_num}</seq_num>
+            <size>{size}</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>
+    </arXivSRC>"""
+
+    manifest = Manifest()
+
+    with pytest.raises(ValueError, match=f'Entry inconsistent: {key} .* out of range in {filename}'):
+        manifest.import_arxiv_xml(io.BytesIO(xml_content.encode('utf-8')))
+
+def test_import_arxiv_xml_parallel_inconsistent_entry(monkeypatch):
+    """
+    Test that an inconsistent file entry processed by a worker process raises ValueError.
+    """
+    monkeypatch.setattr('feck.arxiv.manifest._FILE_ENTRY_BATCH_SIZE', 1)
+    monkeypatch.setattr('feck.arxiv.manifest._PARALLEL_BATCH_THRESHOLD', 0)
+
+    inconsistent_xml_content = """<arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>invalid_filename.tar</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>2364</num_items>
+            <seq_num>1</seq_num>
+            <size>225605507</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>
+    </arXivSRC>"""
     with tempfile.NamedTemporaryFile(delete=False, suffix=".xml") as temp_file:
         temp_file.write(inconsistent_xml_content.encode('utf-8'))
         temp_file_path = temp_file.name
 
     manifest = Manifest()
 
+    try:
+        with pytest.raises(ValueError, match='Entry inconsistent'):
+            manifest.import_arxiv_xml(temp_file_path, max_workers=2)
+    finally:
+        os.remove(temp_file_path)
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_import_arxiv_xml_parallel_error_order(monkeypatch, max_workers):
+    """
+    Test that an inconsistent file entry followed by malformed XML raises the same error
+    with and without worker processes, the error of the inconsistent entry that comes first.
+    """
+    monkeypatch.setattr('feck.arxiv.manifest._FILE_ENTRY_BATCH_SIZE', 1)
+    monkeypatch.setattr('feck.arxiv.manifest._PARALLEL_BATCH_THRESHOLD', 0)
+
+    xml_content = """<arXivSRC>
+        <timestamp>Mon Apr  7 04:58:03 2025</timestamp>
+        <file>
+            <content_md5sum>cacbfede21d5dfef26f367ec99384546</content_md5sum>
+            <filename>invalid_filename.tar</filename>
+            <first_item>astro-ph0001001</first_item>
+            <last_item>quant-ph0001119</last_item>
+            <md5sum>949ae880fbaf4649a485a8d9e07f370b</md5sum>
+            <num_items>2364</num_items>
+            <seq_num>1</seq_num>
+            <size>225605507</size>
+            <timestamp>2010-12-23 00:13:59</timestamp>
+            <yymm>0001</yymm>
+        </file>
+        <file>"""
+
+    manifest = Manifest()
+
     with pytest.raises(ValueError, match='Entry inconsistent'):
-        manifest.import_arxiv_xml(temp_file_path)
+        manifest.import_arxiv_xml(io.BytesIO(xml_content.encode('utf-8')), max_workers=max_workers)
 
-    os.remove(temp_file_path)
+def _freeze_manifest_contents(manifest):
+    """
+    Make the NumPy columns of a shared Manifest instance read-only, so a test mutating them fails loudly.
+    """
+    for column in manifest._manifest['contents'].values():
+        if isinstance(column, np.ndarray):
+            column.setflags(write=False)
+    return manifest
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def manifest_with_data():
     """
     Fixture to provide a Manifest instance with preloaded data.
+    The instance is shared by the tests of the module and its NumPy columns are read-only.
     """
     manifest = Manifest()
     manifest._manifest = {
@@ -497,55 +993,121 @@ def manifest_with_data():
             'manifest_filename': '20250411_arXiv_src_manifest.xml',
             'timestamp_iso': '2025-04-07T08:58:03+00:00'
         },
-        'contents': [
-            {'filename': 'src/arXiv_src_0001_001.tar',
-             'size_bytes': 225605507,
-             'timestamp_iso': '2010-12-23T05:13:59+00:00',
-             'year': 2000,
-             'month': 1,
-             'sequence_number': 1,
-             'n_submissions': 2364,
-             'hash': {'MD5': '949ae880fbaf4649a485a8d9e07f370b',
-                      'MD5_contents': 'cacbfede21d5dfef26f367ec99384546'}},
-            {'filename': 'src/arXiv_src_0002_001.tar',
-             'size_bytes': 227036528,
-             'timestamp_iso': '2010-12-23T05:18:09+00:00',
-             'year': 2000,
-             'month': 2,
-             'sequence_number': 1,
-             'n_submissions': 2365,
-             'hash': {'MD5': '4592ab506cf775afecf4ad560d982a00',
-                      'MD5_contents': 'd90df481661ccdd7e8be883796539743'}},
-            {'filename': 'src/arXiv_src_0003_001.tar',
-             'size_bytes': 230986882,
-             'timestamp_iso': '2010-12-23T05:22:15+00:00',
-             'year': 2000,
-             'month': 3,
-             'sequence_number': 1,
-             'n_submissions': 2600,
-             'hash': {'MD5': 'b5bf5e52ae8532cdf82b606b42df16ea',
-                      'MD5_contents': '3388afd7bfb2dfd9d3f3e6b353357b33'}},
-            {'filename': 'src/arXiv_src_0004_001.tar',
-             'size_bytes': 191559408,
-             'timestamp_iso': '2010-12-23T05:26:31+00:00',
-             'year': 2000,
-             'month': 4,
-             'sequence_number': 1,
-             'n_submissions': 2076,
-             'hash': {'MD5': '9bf1b55890dceec9535ef723a2aea16b',
-                      'MD5_contents': '46abb309d77065fed44965cc26a4ae2e'}},
-            {'filename': 'src/arXiv_src_0005_001.tar',
-             'size_bytes': 255509072,
-             'timestamp_iso': '2010-12-23T05:30:11+00:00',
-             'year': 2000,
-             'month': 5,
-             'sequence_number': 1,
-             'n_submissions': 2724,
-             'hash': {'MD5': 'b49af416746146eca13c5a6a76bc7193',
-                      'MD5_contents': 'ea665c7b62eaac91110fa344f6ba3fc4'}}
-        ]
+        'contents': {
+            'filename': ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar', 'src/arXiv_src_0003_001.tar',
+                         'src/arXiv_src_0004_001.tar', 'src/arXiv_src_0005_001.tar'],
+            'size_bytes': np.array([225605507, 227036528, 230986882, 191559408, 255509072], dtype=np.int64),
+            'timestamp_iso': ['2010-12-23T05:13:59+00:00', '2010-12-23T05:18:09+00:00', '2010-12-23T05:22:15+00:00',
+                              '2010-12-23T05:26:31+00:00', '2010-12-23T05:30:11+00:00'],
+            'year': np.array([2000, 2000, 2000, 2000, 2000], dtype=np.int16),
+            'month': np.array([1, 2, 3, 4, 5], dtype=np.int8),
+            'sequence_number': np.array([1, 1, 1, 1, 1], dtype=np.int32),
+            'n_submissions': np.array([2364, 2365, 2600, 2076, 2724], dtype=np.int32),
+            'md5': ['949ae880fbaf4649a485a8d9e07f370b', '4592ab506cf775afecf4ad560d982a00',
+                    'b5bf5e52ae8532cdf82b606b42df16ea', '9bf1b55890dceec9535ef723a2aea16b',
+                    'b49af416746146eca13c5a6a76bc7193'],
+            'md5_contents': ['cacbfede21d5dfef26f367ec99384546', 'd90df481661ccdd7e8be883796539743',
+                             '3388afd7bfb2dfd9d3f3e6b353357b33', '46abb309d77065fed44965cc26a4ae2e',
+                             'ea665c7b62eaac91110fa344f6ba3fc4']
+        }
     }
-    return manifest
+    return _freeze_manifest_contents(manifest)
+
+def test_iter_file_entries(manifest_with_duplicate_keys):
+    """
+    Test the iter_file_entries method yields one FileEntry per row of the columns.
+    """
+    contents = manifest_with_duplicate_keys._manifest['contents']
+    file_entries = list(manifest_with_duplicate_keys.iter_file_entries())
+
+    assert file_entries == [Manifest._get_contents_entry(contents, index) for index in range(2)]
+    assert file_entries[1].filename == 'src/arXiv_src_0002_001.tar'
+    assert type(file_entries[1].n_submissions) is int
+    assert list(Manifest().iter_file_entries()) == []
+
+def test_to_arrays(manifest_with_duplicate_keys):
+    """
+    Test the to_arrays method returns every column as a NumPy array.
+    """
+    arrays = manifest_with_duplicate_keys.to_arrays()
+
+    assert arrays['filename'].tolist() == ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar']
+    assert arrays['timestamp'].dtype == np.dtype('datetime64[s]')
+    assert arrays['timestamp'].tolist() == np.array(['2010-12-23T05:13:59', '2010-12-23T05:18:09'],
+                                                    dtype='datetime64[s]').tolist()
+    assert arrays['md5'].dtype == np.dtype('S32')
+    assert arrays['md5'].tolist() == [b'949ae880fbaf4649a485a8d9e07f370b', b'4592ab506cf775afecf4ad560d982a00']
+    assert arrays['md5_contents'].dtype == np.dtype('S32')
+    assert arrays['size_bytes'].sum() == 225605507 + 227036528
+    assert arrays['n_submissions'].dtype == np.int32
+
+def test_to_arrays_empty_manifest():
+    """
+    Test the to_arrays method with an empty manifest.
+    """
+    arrays = Manifest().to_arrays()
+
+    assert set(arrays.keys()) == set(Manifest._get_empty_contents().keys()) - {'timestamp_iso'} | {'timestamp'}
+    assert all(len(column) == 0 for column in arrays.values())
+    assert arrays['timestamp'].dtype == np.dtype('datetime64[s]')
+
+@pytest.fixture
+def manifest_with_files(tmp_path):
+    """
+    Fixture to provide a Manifest instance and a directory holding its files, the second file is corrupted
+    and the fourth file is missing.
+    """
+    file_contents = [b'first file', b'second file', b'third file', b'fourth file']
+    filenames = [f'src/arXiv_src_0001_00{index + 1}.tar' for index in range(len(file_contents))]
+
+    (tmp_path / 'src').mkdir()
+    for filename, file_content in zip(filenames[:3], file_contents):
+        (tmp_path / filename).write_bytes(file_content)
+    (tmp_path / filenames[1]).write_bytes(b'corrupted file')
+
+    manifest = Manifest()
+    manifest._manifest['contents'] = dict(Manifest._get_empty_contents(), filename=filenames,
+                                          md5=[hashlib.md5(file_content).hexdigest() for file_content in file_contents])
+    return manifest, str(tmp_path)
+
+def test_verify_hashes(manifest_with_files):
+    """
+    Test the verify_hashes method reports each file.
+    """
+    manifest, root_directory = manifest_with_files
+
+    assert list(manifest.verify_hashes(root_directory)) == [
+        ('src/arXiv_src_0001_001.tar', True),
+        ('src/arXiv_src_0001_002.tar', False),
+        ('src/arXiv_src_0001_003.tar', True),
+        ('src/arXiv_src_0001_004.tar', False),
+    ]
+
+def test_verify_hashes_fail_fast(manifest_with_files, mocker):
+    """
+    Test the verify_hashes method stops after the first mismatch and hashes no further files.
+    """
+    manifest, root_directory = manifest_with_files
+    spy_hash = mocker.spy(HashService, 'calculate_file_hash')
+
+    assert list(manifest.verify_hashes(root_directory, fail_fast=True)) == [
+        ('src/arXiv_src_0001_001.tar', True),
+        ('src/arXiv_src_0001_002.tar', False),
+    ]
+    assert spy_hash.call_count == 2
+
+def test_verify_hashes_lazy(manifest_with_files, mocker):
+    """
+    Test the verify_hashes method only hashes the files whose result is requested.
+    """
+    manifest, root_directory = manifest_with_files
+    spy_hash = mocker.spy(HashService, 'calculate_file_hash')
+
+    first_mismatch = next((filename for filename, is_valid in manifest.verify_hashes(root_directory)
+                           if not is_valid), None)
+
+    assert first_mismatch == 'src/arXiv_src_0001_002.tar'
+    assert spy_hash.call_count == 2
 
 def test_get_statistics(manifest_with_data):
     """
@@ -570,15 +1132,16 @@ def test_get_statistics_empty_manifest():
     Test the get_statistics method with an empty manifest.
     """
     manifest = Manifest()
-    manifest._manifest = {'metadata': {}, 'contents': []}
+    manifest._manifest = {'metadata': {}, 'contents': Manifest._get_empty_contents()}
     statistics = manifest.get_statistics()
 
     assert statistics == {}
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def manifest_with_duplicate_keys():
     """
     Fixture to provide a Manifest instance with duplicate (year, month) keys.
+    The instance is shared by the tests of the module and its NumPy columns are read-only.
     """
     manifest = Manifest()
     manifest._manifest = {
@@ -586,24 +1149,19 @@ def manifest_with_duplicate_keys():
             'manifest_filename': '20250411_arXiv_src_manifest.xml',
             'timestamp_iso': '2025-04-07T08:58:03+00:00'
         },
-        'contents': [
-            {'filename': 'src/arXiv_src_0001_001.tar',
-             'size_bytes': 225605507,
-             'timestamp_iso': '2010-12-23T05:13:59+00:00',
-             'year': 2025,
-             'month': 1,
-             'sequence_number': 1,
-             'n_submissions': 2364},
-            {'filename': 'src/arXiv_src_0002_001.tar',
-             'size_bytes': 227036528,
-             'timestamp_iso': '2010-12-23T05:18:09+00:00',
-             'year': 2025,
-             'month': 1,
-             'sequence_number': 2,
-             'n_submissions': 1000},
-        ]
+        'contents': {
+            'filename': ['src/arXiv_src_0001_001.tar', 'src/arXiv_src_0002_001.tar'],
+            'size_bytes': np.array([225605507, 227036528], dtype=np.int64),
+            'timestamp_iso': ['2010-12-23T05:13:59+00:00', '2010-12-23T05:18:09+00:00'],
+            'year': np.array([2025, 2025], dtype=np.int16),
+            'month': np.array([1, 1], dtype=np.int8),
+            'sequence_number': np.array([1, 2], dtype=np.int32),
+            'n_submissions': np.array([2364, 1000], dtype=np.int32),
+            'md5': ['949ae880fbaf4649a485a8d9e07f370b', '4592ab506cf775afecf4ad560d982a00'],
+            'md5_contents': ['cacbfede21d5dfef26f367ec99384546', 'd90df481661ccdd7e8be883796539743']
+        }
     }
-    return manifest
+    return _freeze_manifest_contents(manifest)
 
 def test_get_statistics_branch_coverage(manifest_with_duplicate_keys):
     """
@@ -622,65 +1180,118 @@ def test_get_statistics_branch_coverage(manifest_with_duplicate_keys):
 
     assert statistics == expected_statistics
 
-@pytest.fixture
-def mock_statistics():
+def test_get_statistics_chronological_order():
     """
-    Fixture to provide mock statistics data for testing.
+    Test that get_statistics returns chronologically ordered keys of Python integers.
     """
-    return {
-        (2025, 1): {'size_bytes': 225605507, 'n_submissions': 2364},
-        (2025, 2): {'size_bytes': 227036528, 'n_submissions': 2365},
-        (2025, 3): {'size_bytes': 230986882, 'n_submissions': 2600},
-    }
+    manifest = Manifest()
+    manifest._manifest['contents'] = Manifest._process_file_entries([
+        {'content_md5sum': 'd90df481661ccdd7e8be883796539743', 'filename': 'src/arXiv_src_0002_001.tar',
+         'first_item': 'astro-ph0002001', 'last_item': 'quant-ph0002094', 'md5sum': '4592ab506cf775afecf4ad560d982a00',
+         'num_items': '2365', 'seq_num': '1', 'size': '227036528', 'timestamp': '2010-12-23 00:18:09', 'yymm': '0002'},
+        {'content_md5sum': 'cacbfede21d5dfef26f367ec99384546', 'filename': 'src/arXiv_src_9912_001.tar',
+         'first_item': 'astro-ph9912001', 'last_item': 'quant-ph9912119', 'md5sum': '949ae880fbaf4649a485a8d9e07f370b',
+         'num_items': '2364', 'seq_num': '1', 'size': '225605507', 'timestamp': '2010-12-23 00:13:59', 'yymm': '9912'},
+    ])
+
+    statistics = manifest.get_statistics()
 
-@pytest.fixture(autouse=True)
+    assert list(statistics.keys()) == [(1999, 12), (2000, 2)]
+    assert all(type(value) is int for key in statistics for value in key)
+    assert all(type(value) is int for entry in statistics.values() for value in entry.values())
+
+@pytest.fixture(scope="module")
+def mock_statistics_arrays():
+    """
+    Fixture to provide mock statistics arrays for testing.
+    """
+    return (np.array([2025, 2025, 2025]), np.array([1, 2, 3]),
+            np.array([225605507, 227036528, 230986882]), np.array([2364, 2365, 2600]))
+
+@pytest.fixture(autouse=True, scope="module")
 def use_agg_backend():
     """
-    Automatically set the matplotlib backend to 'Agg' for all tests.
+    Automatically set the matplotlib backend to 'Agg' once for all tests of the module.
     This prevents plots from being displayed during testing.
     """
     plt.switch_backend('Agg')
 
-def test_plot_summary_statistics(monkeypatch, mock_statistics):
+def test_get_statistics_arrays(manifest_with_duplicate_keys):
+    """
+    Test that _get_statistics_arrays groups the entries into NumPy arrays.
+    """
+    year, month, size_bytes, n_submissions = manifest_with_duplicate_keys._get_statistics_arrays()
+
+    assert year.tolist() == [2025]
+    assert month.tolist() == [1]
+    assert size_bytes.tolist() == [225605507 + 227036528]
+    assert n_submissions.tolist() == [2364 + 1000]
+
+def test_get_statistics_arrays_unsorted():
+    """
+    Test that _get_statistics_arrays groups unsorted entries and sums them exactly in int64.
+    """
+    manifest = Manifest()
+    manifest._manifest['contents'] = dict(
+        Manifest._get_empty_contents(),
+        year=np.array([2001, 1999, 2001, 1999, 2000], dtype=np.int16),
+        month=np.array([3, 12, 3, 1, 7], dtype=np.int8),
+        size_bytes=np.array([2 ** 53, 5, 1, 7, 11], dtype=np.int64),
+        n_submissions=np.array([1, 2, 3, 4, 5], dtype=np.int32)
+    )
+
+    year, month, size_bytes, n_submissions = manifest._get_statistics_arrays()
+
+    assert year.tolist() == [1999, 1999, 2000, 2001]
+    assert month.tolist() == [1, 12, 7, 3]
+    assert size_bytes.tolist() == [7, 5, 11, 2 ** 53 + 1]
+    assert n_submissions.tolist() == [4, 2, 5, 4]
+    assert n_submissions.dtype == np.int64
+
+def test_plot_summary_statistics(monkeypatch, mock_statistics_arrays):
     """
-    Test the plot_summary_statistics method by mocking the output of get_statistics.
+    Test the plot_summary_statistics method by mocking the output of _get_statistics_arrays.
     """
+    plt.close('all')
+
     # Create a Manifest instance
     manifest = Manifest()
 
-    # Mock the get_statistics method
-    def mock_get_statistics(self):
-        return mock_statistics
+    # Mock the _get_statistics_arrays method
+    def mock_get_statistics_arrays(self):
+        return mock_statistics_arrays
 
-    monkeypatch.setattr(Manifest, "get_statistics", mock_get_statistics)
+    monkeypatch.setattr(Manifest, "_get_statistics_arrays", mock_get_statistics_arrays)
 
-    # Call the method
-    manifest.plot_summary_statistics()
+    try:
+        # Call the method
+        manifest.plot_summary_statistics()
 
-    # Get all active figures
-    figures = [plt.figure(i) for i in plt.get_fignums()]
+        # Get all active figures
+        figures = [plt.figure(i) for i in plt.get_fignums()]
 
-    # Ensure three figures were created
-    assert len(figures) == 3
+        # Ensure a single figure with three plots was created
+        assert len(figures) == 1
+        axes = figures[0].axes
+        assert len(axes) == 3
 
-    # Check the titles of the plots
-    expected_titles = [
-        'Number of Submissions per Month',
-        'Size in GB per Month',
-        'Averaged Monthly Submission Size in MB'
-    ]
-    for fig, expected_title in zip(figures, expected_titles):
-        assert fig.axes[0].get_title() == expected_title
+        # Check the titles of the plots
+        expected_titles = [
+            'Number of Submissions per Month',
+            'Size in GB per Month',
+            'Averaged Monthly Submission Size in MB'
+        ]
+        assert [ax.get_title() for ax in axes] == expected_titles
 
-    # Check the x-axis labels
-    expected_xlabels = ['Date (Year-Month)', 'Date (Year-Month)', 'Date (Year-Month)']
-    for fig, expected_xlabel in zip(figures, expected_xlabels):
-        assert fig.axes[0].get_xlabel() == expected_xlabel
+        # Check the x-axis labels
+        assert [ax.get_xlabel() for ax in axes] == ['Date (Year-Month)', 'Date (Year-Month)', 'Date (Year-Month)']
 
-    # Check the y-axis labels
-    expected_ylabels = ['Number of Submissions', 'Size (GB)', 'Average Submission Size (MB)']
-    for fig, expected_ylabel in zip(figures, expected_ylabels):
-        assert fig.axes[0].get_ylabel() == expected_ylabel
+        # Check the y-axis labels
+        expected_ylabels = ['Number of Submissions', 'Size (GB)', 'Average Submission Size (MB)']
+        assert [ax.get_ylabel() for ax in axes] == expected_ylabels
 
-    # Clean up the figures after the test
-    plt.close('all')
+        # Check the dates are the first day of each month
+        dates = axes[0].lines[0].get_xdata()
+        assert dates.tolist() == np.array(['2025-01', '2025-02', '2025-03'], dtype='datetime64[M]').tolist()
+    finally:
+        plt.close('all')
@@ -0,0 +1,27 @@
+# File: conftest.py
+# Description: Shared fixtures for the file handler unit tests.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+import os
+import subprocess
+import pytest
+
+
+def _raise_subprocess_not_allowed(*args, **kwargs):
+    """
+    Replacement for the process spawning functions, file handlers must classify files in process.
+    """
+    raise AssertionError('file handlers must not spawn subprocesses')
+
+
+@pytest.fixture(autouse=True)
+def block_subprocesses(monkeypatch):
+    """
+    Automatically make spawning a subprocess fail in all file handler tests,
+    so a handler shelling out, for example to file(1), fails the tests.
+    """
+    monkeypatch.setattr(subprocess, 'Popen', _raise_subprocess_not_allowed)
+    monkeypatch.setattr(os, 'system', _raise_subprocess_not_allowed)
+    monkeypatch.setattr(os, 'popen', _raise_subprocess_not_allowed)
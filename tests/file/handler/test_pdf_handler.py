@@ -6,6 +6,7 @@
 
 import os
 import pytest
+from typing import Mapping
 
 from feck.file.handler.pdf_handler import PdfHandler
 from feck.file.file_type import FileType
@@ -17,6 +18,7 @@ TEST_DATA_DIRECTORY = os.path.join(TEST_DIRECTORY, 'sample_files')
 
 @pytest.mark.parametrize("file_extension, expected_type", [
     ('.pdf', [FileType.FILE_TYPE_PDF]),
+    ('.PDF', [FileType.FILE_TYPE_PDF]),  # Test case-insensitivity
     ('.pdfq', [FileType.FILE_TYPE_UNKNOWN]),
     ('', [FileType.FILE_TYPE_UNKNOWN]),
 ])
@@ -77,5 +79,8 @@ def test_get_file_extension_map():
     expected_map = {'.pdf': [FileType.FILE_TYPE_PDF]}
     result = PdfHandler.get_file_extension_map()
 
-    assert isinstance(result, dict), "The result should be a dictionary."
+    assert isinstance(result, Mapping), "The result should be a mapping."
     assert result == expected_map, "The returned file extension map is incorrect."
+
+    with pytest.raises(TypeError):
+        result['.txt'] = [FileType.FILE_TYPE_UNKNOWN]  # read-only
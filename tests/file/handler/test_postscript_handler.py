@@ -6,6 +6,8 @@
 
 import os
 import pytest
+import tempfile
+from typing import Mapping
 
 from feck.file.handler.postscript_handler import PostscriptHandler
 from feck.file.file_type import FileType
@@ -21,6 +23,7 @@ TEST_DATA_DIRECTORY = os.path.join(TEST_DIRECTORY, 'sample_files')
     ('.eps', [FileType.FILE_TYPE_POSTSCRIPT_EPS]),
     ('.epsf', [FileType.FILE_TYPE_POSTSCRIPT_EPSF]),
     ('.epsi', [FileType.FILE_TYPE_POSTSCRIPT_EPSI]),
+    ('.EPS', [FileType.FILE_TYPE_POSTSCRIPT_EPS]),  # Test case-insensitivity
     ('.epsijk', [FileType.FILE_TYPE_UNKNOWN]),
     ('', [FileType.FILE_TYPE_UNKNOWN]),
 ])
@@ -45,6 +48,26 @@ def test_is_postscript_format(filename, expected_is_ps_file):
     is_ps_file = PostscriptHandler.is_postscript_format(full_path)
     assert is_ps_file == expected_is_ps_file
 
+@pytest.mark.parametrize("content, expected_is_ps_file", [
+    (b'%!PS-Adobe-3.0 EPSF-3.0 \xc5\xd0\xd3\xc6\xff\xfe\n', True),  # binary data on the header line
+    (b'\xff\xfe%!PS-Adobe-3.0\n', False),                             # binary data before the header
+    (b' \t%!PS-Adobe-3.0\n', True),                                  # blanks before the header
+    (b'\xc5\xd0\xd3\xc6\x1e\x00\x00\x00', True),                           # DOS binary encapsulated postscript header
+    (b'', False),                                                     # empty file
+])
+def test_is_postscript_format_binary_content(content, expected_is_ps_file):
+    """
+    Test the is_postscript method on content that is not valid text.
+    """
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(content)
+        temp_file_path = temp_file.name
+
+    try:
+        assert PostscriptHandler.is_postscript_format(temp_file_path) is expected_is_ps_file
+    finally:
+        os.remove(temp_file_path)
+
 def test_is_postscript_raise_file_not_found():
     """
     Test the is_postscript method when the file is not found or the path directs to a non-file
@@ -86,5 +109,8 @@ def test_get_file_extension_map():
     }
     result = PostscriptHandler.get_file_extension_map()
 
-    assert isinstance(result, dict), "The result should be a dictionary."
-    assert result == expected_map, "The returned file extension map is incorrect."
\ No newline at end of file
+    assert isinstance(result, Mapping), "The result should be a mapping."
+    assert result == expected_map, "The returned file extension map is incorrect."
+
+    with pytest.raises(TypeError):
+        result['.txt'] = [FileType.FILE_TYPE_UNKNOWN]  # read-only
@@ -4,14 +4,27 @@
 # Copyright (c) 2025 Jason Stuber
 # Licensed under the MIT License. See the LICENSE file for more details.
 
+import io
 import os
+import stat
 import tempfile
 import pytest
+import defusedxml.ElementTree as defusedxml_element_tree_implementation
 
 from feck.file.file_type import FileType
 from feck.file.handler.xml_handler import XmlHandler
 
 
+@pytest.fixture(autouse=True)
+def clear_xml_handler_cache():
+    """
+    Clear the cached is_xml_format results around each test.
+    """
+    XmlHandler.clear_cache()
+    yield
+    XmlHandler.clear_cache()
+
+
 def test_get_file_extension_map():
     """
     Test the get_file_extension_map method.
@@ -25,6 +38,14 @@ def test_get_file_extension_map():
     assert XmlHandler.get_file_extension_map() == expected_map
 
 
+def test_get_file_extension_map_read_only():
+    """
+    Test that the file extension map cannot be modified.
+    """
+    with pytest.raises(TypeError):
+        XmlHandler.get_file_extension_map()['.txt'] = [FileType.FILE_TYPE_UNKNOWN]
+
+
 @pytest.mark.parametrize("file_extension, expected_file_type", [
     (".xml", [FileType.FILE_TYPE_XML]),
     (".unknown", [FileType.FILE_TYPE_UNKNOWN]),
@@ -62,32 +83,160 @@ def test_get_file_type_from_format_unknown(mocker):
     assert XmlHandler.get_file_type_from_format("dummy_path.unknown") == FileType.FILE_TYPE_UNKNOWN
 
 
-def test_is_xml_format_with_valid_xml():
+@pytest.fixture(scope="module")
+def valid_xml_file(tmp_path_factory):
+    """
+    Fixture to provide the path to a file holding a valid XML document, written once for the module.
+    """
+    file_path = tmp_path_factory.mktemp('xml') / 'valid.xml'
+    file_path.write_text("<root><child>Test</child></root>")
+    return str(file_path)
+
+
+@pytest.fixture(scope="module")
+def truncated_xml_file(tmp_path_factory):
+    """
+    Fixture to provide the path to a file holding an XML document missing its closing tag, written once for the module.
+    """
+    file_path = tmp_path_factory.mktemp('xml') / 'truncated.xml'
+    file_path.write_text("<root><child>Test</child>")  # Missing closing tag
+    return str(file_path)
+
+
+@pytest.fixture(scope="module")
+def non_xml_file(tmp_path_factory):
+    """
+    Fixture to provide the path to a file holding non-XML content, written once for the module.
+    """
+    file_path = tmp_path_factory.mktemp('xml') / 'not_xml.txt'
+    file_path.write_text("This is not XML content.")
+    return str(file_path)
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason='posix_fadvise not available')
+def test_is_xml_format_sequential_access_hint(tmp_path, mocker):
+    """
+    Test that is_xml_format hints sequential access for a document spanning several reads only,
+    and that iter_xml_items hints sequential access for the files it opens.
+    """
+    small_file_path = tmp_path / 'small.xml'
+    small_file_path.write_text("<root><child>Test</child></root>")
+    large_file_path = tmp_path / 'large.xml'
+    large_file_path.write_text("<root>" + "<child>Test</child>" * 10000 + "</root>")
+    mock_fadvise = mocker.patch('os.posix_fadvise')
+
+    assert XmlHandler.is_xml_format(str(small_file_path)) is True
+    assert mock_fadvise.call_count == 0
+
+    assert XmlHandler.is_xml_format(str(large_file_path)) is True
+    assert mock_fadvise.call_count == 1
+    assert mock_fadvise.call_args.args[1:] == (0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    assert list(XmlHandler.iter_xml_items(str(small_file_path))) == [('root', 'child', 'Test')]
+    assert mock_fadvise.call_count == 2
+
+
+def test_is_xml_format_with_valid_xml(valid_xml_file):
     """
     Test the is_xml_format method with valid XML content.
 
-    This test creates a temporary file containing valid XML content and verifies
+    This test uses a file containing valid XML content and verifies
     that the method correctly identifies it as XML.
     """
-    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
-        temp_file.write("<root><child>Test</child></root>")
+    assert XmlHandler.is_xml_format(valid_xml_file) is True
+
+
+def test_is_xml_format_with_invalid_xml(truncated_xml_file):
+    """
+    Test the is_xml_format method with invalid XML content.
+
+    This test uses a file containing invalid XML content (missing a closing tag)
+    and verifies that the method correctly identifies it as not being XML.
+    """
+    assert XmlHandler.is_xml_format(truncated_xml_file) is False
+
+
+def test_is_xml_format_with_non_xml_content(non_xml_file):
+    """
+    Test the is_xml_format method with non-XML content.
+
+    This test uses a file containing non-XML content and verifies
+    that the method correctly identifies it as not being XML.
+    """
+    assert XmlHandler.is_xml_format(non_xml_file) is False
+
+
+@pytest.mark.parametrize("content, expected_is_xml", [
+    (b"\xef\xbb\xbf  \n<root><child>Test</child></root>", True),           # byte order mark and whitespace
+    (b"<?xml version='1.0'?><root/>", True),
+    (b"\x1f\x8b\x08\x00\x00\x00\x00\x00", False),                          # gzip header, not text
+    (b"%PDF-1.4\n<root/>", False),
+    (b"", False),
+])
+def test_is_xml_format_leading_bytes(content, expected_is_xml):
+    """
+    Test the is_xml_format method on the leading bytes of the file.
+    """
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(content)
         temp_file_path = temp_file.name
 
     try:
-        assert XmlHandler.is_xml_format(temp_file_path) is True
+        assert XmlHandler.is_xml_format(temp_file_path) is expected_is_xml
     finally:
         os.remove(temp_file_path)
 
 
-def test_is_xml_format_with_invalid_xml():
+@pytest.mark.parametrize("content, expected_is_xml", [
+    (b"<?xml version='1.0'?><root/>", True),
+    (b"\xef\xbb\xbf  \n<root><child>Test</child>", True),                  # byte order mark, truncated document
+    ('<?xml version="1.0" encoding="UTF-16"?><root/>'.encode('utf-16'), True),  # UTF-16 with byte order mark
+    (b"<!-- comment --><root/>", True),
+    (b"<!DOCTYPE root><root/>", True),
+    (b"<?xmlfoo?>", False),
+    (b"< root/>", False),
+    (b"This is not XML content.", False),
+    (b"\x1f\x8b\x08\x00\x00\x00\x00\x00", False),                          # gzip header, not text
+    (b"", False),
+])
+def test_is_xml_format_not_strict(content, expected_is_xml, mocker):
     """
-    Test the is_xml_format method with invalid XML content.
+    Test the is_xml_format method checking the leading bytes only, without running the parser.
+    """
+    spy_parser = mocker.spy(defusedxml_element_tree_implementation, 'DefusedXMLParser')
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(content)
+        temp_file_path = temp_file.name
 
-    This test creates a temporary file containing invalid XML content (missing a closing tag)
-    and verifies that the method correctly identifies it as not being XML.
+    try:
+        assert XmlHandler.is_xml_format(temp_file_path, strict=False) is expected_is_xml
+        assert spy_parser.call_count == 0
+    finally:
+        os.remove(temp_file_path)
+
+
+def test_is_xml_format_not_strict_raise_file_not_found(tmp_path):
+    """
+    Test the is_xml_format method checking the leading bytes only when the path is not a file.
+    """
+    with pytest.raises(FileNotFoundError, match="file not found"):
+        XmlHandler.is_xml_format("non_existent_file.xml", strict=False)
+
+    with pytest.raises(FileNotFoundError, match="file not found"):
+        XmlHandler.is_xml_format(str(tmp_path), strict=False)
+
+
+@pytest.mark.parametrize("content", [
+    '<?xml version="1.0"?><!DOCTYPE root [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;">]>'
+    '<root>&b;</root>',                                                              # entity expansion
+    '<?xml version="1.0"?><!DOCTYPE root [<!ENTITY e SYSTEM "http://example.com/e.xml">]><root>&e;</root>',
+])
+def test_is_xml_format_rejects_entity_declarations(content):
+    """
+    Test that is_xml_format rejects documents declaring entities, which could expand or fetch external resources.
     """
     with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
-        temp_file.write("<root><child>Test</child>")  # Missing closing tag
+        temp_file.write(content)
         temp_file_path = temp_file.name
 
     try:
@@ -96,19 +245,33 @@ def test_is_xml_format_with_invalid_xml():
         os.remove(temp_file_path)
 
 
-def test_is_xml_format_with_non_xml_content():
+def test_is_xml_format_rejects_without_parsing(mocker):
     """
-    Test the is_xml_format method with non-XML content.
-
-    This test creates a temporary file containing non-XML content and verifies
-    that the method correctly identifies it as not being XML.
+    Test that is_xml_format rejects a file that cannot start with XML without running the parser.
     """
     with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
-        temp_file.write("This is not XML content.")
+        temp_file.write("%PDF-1.4\n" + "<root>" * 1000)
         temp_file_path = temp_file.name
 
     try:
+        mock_parser = mocker.patch.object(defusedxml_element_tree_implementation, 'DefusedXMLParser')
         assert XmlHandler.is_xml_format(temp_file_path) is False
+        mock_parser.return_value.feed.assert_not_called()
+    finally:
+        os.remove(temp_file_path)
+
+
+def test_is_xml_format_large_document(mocker):
+    """
+    Test the is_xml_format method with a document spanning several reads.
+    """
+    mocker.patch.object(XmlHandler, '_read_size', 16)
+    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
+        temp_file.write("<root>" + "<child>Test</child>" * 100 + "</root>")
+        temp_file_path = temp_file.name
+
+    try:
+        assert XmlHandler.is_xml_format(temp_file_path) is True
     finally:
         os.remove(temp_file_path)
 
@@ -125,6 +288,20 @@ def test_is_xml_format_file_not_found(mocker):
         XmlHandler.is_xml_format("non_existent_file.xml")
 
 
+@pytest.mark.parametrize("xml_method", [
+    XmlHandler.is_xml_format,
+    XmlHandler.read_xml_to_dict,
+    lambda file_path: list(XmlHandler.iter_xml_items(file_path)),
+])
+def test_xml_methods_directory_not_file(xml_method):
+    """
+    Test that the XML methods raise FileNotFoundError when the path directs to a directory.
+    """
+    with tempfile.TemporaryDirectory() as temp_directory:
+        with pytest.raises(FileNotFoundError, match="file not found"):
+            xml_method(temp_directory)
+
+
 def test_is_xml_format_with_mocked_file(mocker):
     """
     Test the is_xml_format method with mocked valid XML content.
@@ -135,6 +312,7 @@ def test_is_xml_format_with_mocked_file(mocker):
     mock_data = "<root><child>Test</child></root>"
     mocker.patch("builtins.open", mocker.mock_open(read_data=mock_data))
     mocker.patch("os.path.isfile", return_value=True)
+    mocker.patch("os.stat", return_value=mocker.Mock(st_mode=stat.S_IFREG, st_mtime_ns=0, st_size=len(mock_data)))
     assert XmlHandler.is_xml_format("mocked_file.xml") is True
 
 
@@ -148,8 +326,34 @@ def test_is_xml_format_with_mocked_invalid_xml(mocker):
     mock_data = "<root><child>Test</child>"  # Missing closing tag
     mocker.patch("builtins.open", mocker.mock_open(read_data=mock_data))
     mocker.patch("os.path.isfile", return_value=True)
+    mocker.patch("os.stat", return_value=mocker.Mock(st_mode=stat.S_IFREG, st_mtime_ns=0, st_size=len(mock_data)))
     assert XmlHandler.is_xml_format("mocked_file.xml") is False
 
+def test_is_xml_format_cached(mocker):
+    """
+    Test that is_xml_format parses an unchanged file only once, and again once the file changes.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
+        temp_file.write("<root><child>Test</child></root>")
+        temp_file_path = temp_file.name
+
+    try:
+        spy_parser = mocker.spy(defusedxml_element_tree_implementation, 'DefusedXMLParser')
+
+        assert XmlHandler.is_xml_format(temp_file_path) is True
+        assert XmlHandler.is_xml_format(temp_file_path) is True
+        assert XmlHandler.get_file_type_from_format(temp_file_path) == FileType.FILE_TYPE_XML
+        assert spy_parser.call_count == 1
+
+        with open(temp_file_path, 'w') as file_handle:
+            file_handle.write("<root><child>Test</child>")  # Missing closing tag
+
+        assert XmlHandler.is_xml_format(temp_file_path) is False
+        assert spy_parser.call_count == 2
+    finally:
+        os.remove(temp_file_path)
+
+
 def test_read_xml_to_dict_file_not_found(mocker):
     """
     Test that read_xml_to_dict raises FileNotFoundError when the file does not exist.
@@ -159,14 +363,19 @@ def test_read_xml_to_dict_file_not_found(mocker):
         XmlHandler.read_xml_to_dict("non_existent_file.xml")
 
 
-def test_read_xml_to_dict_not_xml_format(mocker):
+def test_read_xml_to_dict_not_xml_format():
     """
     Test that read_xml_to_dict raises TypeError when the file is not in XML format.
     """
-    mocker.patch("os.path.isfile", return_value=True)
-    mocker.patch("feck.file.handler.xml_handler.XmlHandler.is_xml_format", return_value=False)
-    with pytest.raises(TypeError, match="file not in XML format"):
-        XmlHandler.read_xml_to_dict("not_xml_file.xml")
+    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
+        temp_file.write("<root><child>Test</child>")  # Missing closing tag
+        temp_file_path = temp_file.name
+
+    try:
+        with pytest.raises(TypeError, match="file not in XML format"):
+            XmlHandler.read_xml_to_dict(temp_file_path)
+    finally:
+        os.remove(temp_file_path)
 
 
 def test_read_xml_to_dict_valid_xml(mocker):
@@ -174,13 +383,27 @@ def test_read_xml_to_dict_valid_xml(mocker):
     Test that read_xml_to_dict correctly parses valid XML content into a dictionary.
     """
     mocker.patch("os.path.isfile", return_value=True)
-    mocker.patch("feck.file.handler.xml_handler.XmlHandler.is_xml_format", return_value=True)
-    mocker.patch("builtins.open", mocker.mock_open(read_data="<root><child>Test</child></root>"))
+    mock_open = mocker.patch("builtins.open", mocker.mock_open(read_data=b"<root><child>Test</child></root>"))
     mock_xmltodict = mocker.patch("feck.file.handler.xml_handler.xmltodict_implementation.parse", return_value={"root": {"child": "Test"}})
 
     result = XmlHandler.read_xml_to_dict("valid_file.xml")
     assert result == {"root": {"child": "Test"}}
-    mock_xmltodict.assert_called_once_with("<root><child>Test</child></root>")
+    mock_open.assert_called_once_with("valid_file.xml", 'rb')
+    mock_xmltodict.assert_called_once_with(mock_open.return_value)
+
+
+def test_read_xml_to_dict_valid_xml_file():
+    """
+    Test that read_xml_to_dict parses a valid XML file into a dictionary with a single read of the file.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
+        temp_file.write("<root><child>Test</child><child>Again</child></root>")
+        temp_file_path = temp_file.name
+
+    try:
+        assert XmlHandler.read_xml_to_dict(temp_file_path) == {"root": {"child": ["Test", "Again"]}}
+    finally:
+        os.remove(temp_file_path)
 
 
 def test_read_xml_to_dict_invalid_xml_parsing(mocker):
@@ -188,9 +411,98 @@ def test_read_xml_to_dict_invalid_xml_parsing(mocker):
     Test that read_xml_to_dict raises ValueError when XML parsing fails.
     """
     mocker.patch("os.path.isfile", return_value=True)
-    mocker.patch("feck.file.handler.xml_handler.XmlHandler.is_xml_format", return_value=True)
-    mocker.patch("builtins.open", mocker.mock_open(read_data="<root><child>Test</child>"))  # Malformed XML
+    mocker.patch("builtins.open", mocker.mock_open(read_data=b"<root><child>Test</child>"))
     mocker.patch("feck.file.handler.xml_handler.xmltodict_implementation.parse", side_effect=Exception("Parsing error"))
 
     with pytest.raises(ValueError, match="Failed to parse XML content: Parsing error"):
         XmlHandler.read_xml_to_dict("invalid_file.xml")
+
+
+def test_iter_xml_items():
+    """
+    Test that iter_xml_items yields each child of the root element in document order,
+    in the same form as read_xml_to_dict.
+    """
+    xml_content = ("<root><timestamp> Mon </timestamp>"
+                   "<file><name>a</name><empty/></file>"
+                   "<file><name>b</name><name>c</name></file></root>")
+    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
+        temp_file.write(xml_content)
+        temp_file_path = temp_file.name
+
+    try:
+        assert list(XmlHandler.iter_xml_items(temp_file_path)) == [
+            ('root', 'timestamp', 'Mon'),
+            ('root', 'file', {'name': 'a', 'empty': None}),
+            ('root', 'file', {'name': ['b', 'c']}),
+        ]
+    finally:
+        os.remove(temp_file_path)
+
+
+def test_iter_xml_items_file_object():
+    """
+    Test that iter_xml_items reads an opened binary file object without closing it.
+    """
+    file_handle = io.BytesIO(b"<root><file><name>a</name></file><timestamp>Mon</timestamp></root>")
+
+    assert list(XmlHandler.iter_xml_items(file_handle)) == [
+        ('root', 'file', {'name': 'a'}),
+        ('root', 'timestamp', 'Mon'),
+    ]
+    assert not file_handle.closed
+
+    with pytest.raises(TypeError, match="file not in XML format"):
+        list(XmlHandler.iter_xml_items(io.BytesIO(b"<root><child>Test</child>")))
+
+
+@pytest.mark.parametrize("content, expected_items", [
+    (b'<root id="1" kind="x"><file>a</file></root>',                 # attributes of the root element
+     [('root', '@id', '1'), ('root', '@kind', 'x'), ('root', 'file', 'a')]),
+    (b'<root>stray <file>a</file> more <file>b</file> tail</root>',  # text of the root element between children
+     [('root', 'file', 'a'), ('root', 'file', 'b'), ('root', '#text', 'straymoretail')]),
+    (b'<root>only text</root>',                                        # root element without children
+     [('root', '#text', 'only text')]),
+    (b'<root>\n  <file>a</file>\n</root>',                            # whitespace between children is dropped
+     [('root', 'file', 'a')]),
+])
+def test_iter_xml_items_root_attributes_and_text(content, expected_items):
+    """
+    Test that iter_xml_items yields the attributes and the text of the root element, as read_xml_to_dict keeps them.
+    """
+    assert list(XmlHandler.iter_xml_items(io.BytesIO(content))) == expected_items
+
+
+@pytest.mark.parametrize("content", [
+    b'<!DOCTYPE root [<!ENTITY a "aaaaaaaaaa">]><root><file>&a;</file></root>',             # internal entity
+    b'<!DOCTYPE root [<!ENTITY a SYSTEM "file:///etc/passwd">]><root><file>&a;</file></root>',  # external entity
+])
+def test_iter_xml_items_entities_rejected(content):
+    """
+    Test that iter_xml_items rejects documents declaring entities instead of expanding them.
+    """
+    with pytest.raises(TypeError, match="file not in XML format"):
+        list(XmlHandler.iter_xml_items(io.BytesIO(content)))
+
+
+def test_iter_xml_items_file_not_found():
+    """
+    Test that iter_xml_items raises FileNotFoundError when the file does not exist.
+    """
+    with pytest.raises(FileNotFoundError, match="file not found"):
+        list(XmlHandler.iter_xml_items("non_existent_file.xml"))
+
+
+def test_iter_xml_items_not_xml_format():
+    """
+    Test that iter_xml_items raises TypeError when the file is not in XML format.
+    """
+    with tempfile.NamedTemporaryFile(delete=False, mode='w') as temp_file:
+        temp_file.write("<root><child>Test</child>")  # Missing closing tag
+        temp_file_path = temp_file.name
+
+    try:
+        with pytest.raises(TypeError, match="file not in XML format"):
+            list(XmlHandler.iter_xml_items(temp_file_path))
+    finally:
+        os.remove(temp_file_path)
@@ -0,0 +1,88 @@
+# File: test_file_classifier.py
+# Description: Unit tests for the FileClassifier class.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+import os
+import pytest
+
+from feck.file.file_classifier import FileClassifier
+from feck.file.file_type import FileType
+from feck.file.format_sniffer import FormatSniffer
+
+# test data directory
+TEST_DIRECTORY = os.path.dirname(__file__)
+TEST_DATA_DIRECTORY = os.path.join(TEST_DIRECTORY, 'sample_files')
+
+
+@pytest.mark.parametrize("file_extension, expected_file_type", [
+    ('.pdf', FileType.FILE_TYPE_PDF),
+    ('.ps', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    ('.EPS', FileType.FILE_TYPE_POSTSCRIPT_EPS),  # Test case-insensitivity
+    ('.epsi', FileType.FILE_TYPE_POSTSCRIPT_EPSI),
+    ('.xml', FileType.FILE_TYPE_XML),
+    ('.txt', FileType.FILE_TYPE_UNKNOWN),
+    ('', FileType.FILE_TYPE_UNKNOWN),
+])
+def test_get_file_type_from_extension(file_extension, expected_file_type):
+    """
+    Test the get_file_type_from_extension method over all file handlers.
+    """
+    assert FileClassifier.get_file_type_from_extension(file_extension) == expected_file_type
+
+@pytest.mark.parametrize("directory, expected_file_types", [
+    ('pdf', {'pdf_file.pdf': FileType.FILE_TYPE_PDF,
+             'pdf_file_bad_truncated.pdf': FileType.FILE_TYPE_UNKNOWN,
+             'pdf_file_wrong_header.pdf': FileType.FILE_TYPE_UNKNOWN}),
+    ('ps', {'eps_file.eps': FileType.FILE_TYPE_POSTSCRIPT_EPS,
+            'ps_file.ps': FileType.FILE_TYPE_POSTSCRIPT_PS,
+            'ps_file_wrong_header.ps': FileType.FILE_TYPE_UNKNOWN}),
+])
+def test_classify_directory_sample_files(directory, expected_file_types):
+    """
+    Test the classify_directory method on the sample files.
+    """
+    directory_path = os.path.join(TEST_DATA_DIRECTORY, directory)
+
+    file_types = dict(FileClassifier.classify_directory(directory_path))
+
+    assert file_types == {os.path.join(directory_path, filename): file_type
+                          for filename, file_type in expected_file_types.items()}
+
+def test_classify_directory_opens_known_extensions_only(tmp_path, mocker):
+    """
+    Test that classify_directory skips subdirectories and only opens files with an extension known to a handler.
+    """
+    (tmp_path / 'document.PDF').write_bytes(b'%PDF-1.4\n')
+    (tmp_path / 'notes.txt').write_bytes(b'%PDF-1.4\n')
+    (tmp_path / 'manifest.xml').write_bytes(b'<root/>')
+    (tmp_path / 'subdirectory.pdf').mkdir()
+    FormatSniffer.clear_cache()
+    spy_read_header = mocker.spy(FormatSniffer, 'read_header')
+
+    file_types = dict(FileClassifier.classify_directory(str(tmp_path)))
+
+    assert file_types == {str(tmp_path / 'document.PDF'): FileType.FILE_TYPE_PDF,
+                          str(tmp_path / 'notes.txt'): FileType.FILE_TYPE_UNKNOWN,
+                          str(tmp_path / 'manifest.xml'): FileType.FILE_TYPE_XML}
+    assert spy_read_header.call_count == 1
+
+    spy_read_header.reset_mock()
+    file_types = dict(FileClassifier.classify_directory(str(tmp_path), verify_format=False))
+
+    assert file_types[str(tmp_path / 'document.PDF')] == FileType.FILE_TYPE_PDF
+    assert spy_read_header.call_count == 0
+
+def test_classify_directory_raise_directory_not_found(tmp_path):
+    """
+    Test the classify_directory method when the path is not a directory.
+    """
+    file_path = tmp_path / 'file.pdf'
+    file_path.write_bytes(b'%PDF-1.4\n')
+
+    with pytest.raises(FileNotFoundError):
+        list(FileClassifier.classify_directory(str(tmp_path / 'missing')))
+
+    with pytest.raises(FileNotFoundError):
+        list(FileClassifier.classify_directory(str(file_path)))
@@ -23,13 +23,13 @@ def test_enum_values():
     """
     Test that the FileType enum values match expected values
     """
-    assert FileType.FILE_TYPE_UNKNOWN.value == 'UNKNOWN'
-    assert FileType.FILE_TYPE_PDF.value == 'PDF'
-    assert FileType.FILE_TYPE_POSTSCRIPT_PS.value == 'POSTSCRIPT_PS'
-    assert FileType.FILE_TYPE_POSTSCRIPT_EPS.value == 'POSTSCRIPT_EPS'
-    assert FileType.FILE_TYPE_POSTSCRIPT_EPSF.value == 'POSTSCRIPT_EPSF'
-    assert FileType.FILE_TYPE_POSTSCRIPT_EPSI.value == 'POSTSCRIPT_EPSI'
-    assert FileType.FILE_TYPE_XML.value == 'XML'
+    assert FileType.FILE_TYPE_UNKNOWN.value == 0
+    assert FileType.FILE_TYPE_PDF.value == 1
+    assert FileType.FILE_TYPE_POSTSCRIPT_PS.value == 2
+    assert FileType.FILE_TYPE_POSTSCRIPT_EPS.value == 3
+    assert FileType.FILE_TYPE_POSTSCRIPT_EPSF.value == 4
+    assert FileType.FILE_TYPE_POSTSCRIPT_EPSI.value == 5
+    assert FileType.FILE_TYPE_XML.value == 6
 
 def test_enum_no_extra_members():
     """
@@ -41,3 +41,22 @@ def test_enum_no_extra_members():
                         'FILE_TYPE_XML'}
     actual_members = set(FileType.__members__.keys())
     assert actual_members == expected_members, f"Unexpected members found: {actual_members - expected_members}"
+
+def test_enum_names():
+    """
+    Test that the FileType names are unchanged by the integer values
+    """
+    assert FileType.FILE_TYPE_UNKNOWN.name == 'FILE_TYPE_UNKNOWN'
+    assert FileType(1) is FileType.FILE_TYPE_PDF
+
+def test_enum_labels():
+    """
+    Test that the FileType labels match the string form of each member
+    """
+    assert FileType.FILE_TYPE_UNKNOWN.label == 'UNKNOWN'
+    assert FileType.FILE_TYPE_PDF.label == 'PDF'
+    assert FileType.FILE_TYPE_POSTSCRIPT_PS.label == 'POSTSCRIPT_PS'
+    assert FileType.FILE_TYPE_POSTSCRIPT_EPS.label == 'POSTSCRIPT_EPS'
+    assert FileType.FILE_TYPE_POSTSCRIPT_EPSF.label == 'POSTSCRIPT_EPSF'
+    assert FileType.FILE_TYPE_POSTSCRIPT_EPSI.label == 'POSTSCRIPT_EPSI'
+    assert FileType.FILE_TYPE_XML.label == 'XML'
@@ -0,0 +1,134 @@
+# File: test_format_sniffer.py
+# Description: Unit tests for the FormatSniffer class.
+#
+# Copyright (c) 2025 Jason Stuber
+# Licensed under the MIT License. See the LICENSE file for more details.
+
+import os
+import pytest
+
+from feck.file.file_type import FileType
+from feck.file.format_sniffer import FormatSniffer
+
+# test data directory
+TEST_DIRECTORY = os.path.dirname(__file__)
+TEST_DATA_DIRECTORY = os.path.join(TEST_DIRECTORY, 'sample_files')
+
+
+@pytest.mark.parametrize("header, expected_file_type", [
+    (b'%PDF-1.4\n', FileType.FILE_TYPE_PDF),
+    (b'%PDF', FileType.FILE_TYPE_UNKNOWN),                       # truncated magic number
+    (b'%!PostScript\n', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    (b'%!PS-Adobe-3.0 EPSF-3.0\n', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    (b'%!PS-Adobe-2.0\n', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    (b'%!PS-Adobe-1.0\n', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    (b'%!PS-Adabe-2.0\n', FileType.FILE_TYPE_UNKNOWN),           # misspelled header
+    (b'\xc5\xd0\xd3\xc6\x1e\x00', FileType.FILE_TYPE_POSTSCRIPT_PS),  # DOS binary encapsulated postscript
+    (b'<?xml version="1.0"?>', FileType.FILE_TYPE_XML),
+    (b'', FileType.FILE_TYPE_UNKNOWN),
+    (b' %PDF-1.4\n', FileType.FILE_TYPE_UNKNOWN),                # magic number not at the start
+    (b'  \t%!PS-Adobe-3.0\n', FileType.FILE_TYPE_POSTSCRIPT_PS),  # blanks before the postscript header comment
+    (b'\n%!PS-Adobe-3.0\n', FileType.FILE_TYPE_UNKNOWN),         # postscript header not on the first line
+    (b' \xc5\xd0\xd3\xc6\x1e\x00', FileType.FILE_TYPE_UNKNOWN),   # binary magic number not at the start
+])
+def test_get_file_type_from_header(header, expected_file_type):
+    """
+    Test the get_file_type_from_header method for each magic number.
+    """
+    assert FormatSniffer.get_file_type_from_header(header) == expected_file_type
+
+def test_magic_number_pattern_matches_map():
+    """
+    Test that the combined magic number pattern resolves every magic number to its file type.
+    """
+    for magic_number, file_type in FormatSniffer._magic_number_map:
+        assert FormatSniffer.get_file_type_from_header(magic_number + b'\n') == file_type
+
+@pytest.mark.parametrize("filename, expected_file_type", [
+    ('pdf/pdf_file.pdf', FileType.FILE_TYPE_PDF),
+    ('pdf/pdf_file_wrong_header.pdf', FileType.FILE_TYPE_UNKNOWN),
+    ('pdf/pdf_file_bad_truncated.pdf', FileType.FILE_TYPE_UNKNOWN),
+    ('ps/ps_file.ps', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    ('ps/eps_file.eps', FileType.FILE_TYPE_POSTSCRIPT_PS),
+    ('ps/ps_file_wrong_header.ps', FileType.FILE_TYPE_UNKNOWN),
+])
+def test_sniff_file_type(filename, expected_file_type):
+    """
+    Test the sniff_file_type method on the sample files.
+    """
+    full_path = os.path.join(TEST_DATA_DIRECTORY, filename)
+    assert FormatSniffer.sniff_file_type(full_path) == expected_file_type
+
+def test_read_header():
+    """
+    Test that read_header returns the leading bytes of the file, bounded by the file length.
+    """
+    assert FormatSniffer.read_header(os.path.join(TEST_DATA_DIRECTORY, 'pdf/pdf_file.pdf')).startswith(b'%PDF-1.4')
+    assert FormatSniffer.read_header(os.path.join(TEST_DATA_DIRECTORY, 'pdf/pdf_file_bad_truncated.pdf')) == b'%PDF'
+
+def test_read_header_cached(tmp_path, mocker):
+    """
+    Test that read_header reads an unchanged file only once, and again once the file changes.
+    """
+    FormatSniffer.clear_cache()
+    file_path = tmp_path / 'file.pdf'
+    file_path.write_bytes(b'%PDF-1.4\n')
+    spy_read = mocker.spy(os, 'read')
+
+    assert FormatSniffer.sniff_file_type(str(file_path)) == FileType.FILE_TYPE_PDF
+    assert FormatSniffer.sniff_file_type(str(file_path)) == FileType.FILE_TYPE_PDF
+    assert spy_read.call_count == 1
+
+    file_path.write_bytes(b'%!PS-Adobe-3.0\n')
+    assert FormatSniffer.sniff_file_type(str(file_path)) == FileType.FILE_TYPE_POSTSCRIPT_PS
+    assert spy_read.call_count == 2
+
+    FormatSniffer.clear_cache()
+    assert FormatSniffer.read_header(str(file_path)) == b'%!PS-Adobe-3.0\n'
+    assert spy_read.call_count == 3
+
+def test_read_header_raise_file_not_found():
+    """
+    Test the read_header method when the file is not found or the path directs to a non-file.
+    """
+    with pytest.raises(FileNotFoundError):
+        FormatSniffer.read_header(TEST_DATA_DIRECTORY)
+
+    with pytest.raises(FileNotFoundError):
+        FormatSniffer.read_header('this_is_not_a_file')
+
+def test_sniff_file_types():
+    """
+    Test that sniff_file_types classifies many files and preserves their order.
+    """
+    filenames = ['pdf/pdf_file.pdf', 'ps/ps_file.ps', 'pdf/pdf_file_wrong_header.pdf', 'ps/eps_file.eps'] * 8
+    full_paths = [os.path.join(TEST_DATA_DIRECTORY, filename) for filename in filenames]
+
+    file_types = FormatSniffer.sniff_file_types(full_paths, max_workers=4)
+
+    assert file_types == [FormatSniffer.sniff_file_type(full_path) for full_path in full_paths]
+    assert file_types[:4] == [FileType.FILE_TYPE_PDF, FileType.FILE_TYPE_POSTSCRIPT_PS,
+                              FileType.FILE_TYPE_UNKNOWN, FileType.FILE_TYPE_POSTSCRIPT_PS]
+
+@pytest.mark.parametrize("file_paths", [[], [os.path.join(TEST_DATA_DIRECTORY, 'pdf/pdf_file.pdf')]])
+def test_sniff_file_types_few_paths(file_paths):
+    """
+    Test sniff_file_types with no path or a single path.
+    """
+    assert FormatSniffer.sniff_file_types(file_paths) == [FileType.FILE_TYPE_PDF] * len(file_paths)
+
+def test_sniff_file_types_raise_file_not_found():
+    """
+    Test that sniff_file_types raises FileNotFoundError when one of the files is not found.
+    """
+    full_paths = [os.path.join(TEST_DATA_DIRECTORY, 'pdf/pdf_file.pdf'), 'this_is_not_a_file']
+    with pytest.raises(FileNotFoundError):
+        FormatSniffer.sniff_file_types(full_paths)
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_sniff_file_types_raise_max_workers_not_positive(max_workers):
+    """
+    Test that sniff_file_types raises ValueError when the maximum number of workers is not positive.
+    """
+    with pytest.raises(ValueError):
+        FormatSniffer.sniff_file_types([], max_workers=max_workers)
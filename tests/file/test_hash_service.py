@@ -5,9 +5,11 @@
 # Licensed under the MIT License. See the LICENSE file for more details.
 
 from hashlib import md5, sha256, sha512, sha3_512
+import io
 import os
 import pytest
 import tempfile
+from xxhash import xxh3_128
 
 from feck.file.hash_service import HashType, HashService
 
@@ -21,12 +23,13 @@ def test_enum():
     assert HashType.HASH_TYPE_SHA256.value == 'SHA256'
     assert HashType.HASH_TYPE_SHA512.value == 'SHA512'
     assert HashType.HASH_TYPE_SHA3_512.value == 'SHA3_512'
+    assert HashType.HASH_TYPE_XXH3_128.value == 'XXH3_128'
 
 def test_enum_unchanged():
     """
     Test that the enum values have not been extended.
     """
-    assert len(HashType) == 4
+    assert len(HashType) == 5
 
 # Test for HashService
 TEST_DIRECTORY = os.path.dirname(os.path.dirname(__file__))
@@ -37,6 +40,7 @@ TEST_DATA_DIRECTORY = os.path.join(TEST_DIRECTORY, 'test_data')
     (HashType.HASH_TYPE_SHA256, True),
     (HashType.HASH_TYPE_SHA512, True),
     (HashType.HASH_TYPE_SHA3_512, True),
+    (HashType.HASH_TYPE_XXH3_128, True),
     (1337, False),
 ])
 def test_is_hash_type_allowed(hash_type_category, expected_is_allowed):
@@ -50,6 +54,7 @@ def test_is_hash_type_allowed(hash_type_category, expected_is_allowed):
     (HashType.HASH_TYPE_SHA256, sha256(), 'sha256'),
     (HashType.HASH_TYPE_SHA512, sha512(), 'sha512'),
     (HashType.HASH_TYPE_SHA3_512, sha3_512(), 'sha3_512'),
+    (HashType.HASH_TYPE_XXH3_128, xxh3_128(), 'XXH3_128'),
 ])
 def test_get_hash_encoder_instance(hash_type_category, expected_encoder, expected_encoder_name):
     """
@@ -59,6 +64,20 @@ def test_get_hash_encoder_instance(hash_type_category, expected_encoder, expecte
     assert isinstance(encoder, type(expected_encoder))
     assert encoder.name == expected_encoder_name
 
+@pytest.mark.parametrize("hash_type_category", list(HashType))
+def test_get_hash_encoder_instance_independent(hash_type_category):
+    """
+    Test that the instances of the _get_hash_encoder_instance method are fresh and independent of each other.
+    """
+    first_encoder = HashService._get_hash_encoder_instance(hash_type_category)
+    first_encoder.update(b"This is a test file content for hashing.")
+    second_encoder = HashService._get_hash_encoder_instance(hash_type_category)
+
+    assert second_encoder is not first_encoder
+    hash_encoder_factory = HashService._hash_type_encoder_map[hash_type_category]
+    assert second_encoder.hexdigest() == hash_encoder_factory().hexdigest()
+    assert first_encoder.hexdigest() == hash_encoder_factory(b"This is a test file content for hashing.").hexdigest()
+
 def test_get_hash_encoder_instance_raise_hash_type_category_unknown():
     """
     Test the _get_hash_encoder_instance method when the hash type category is unknown.
@@ -66,6 +85,15 @@ def test_get_hash_encoder_instance_raise_hash_type_category_unknown():
     with pytest.raises(ValueError):
         HashService._get_hash_encoder_instance(1337)
 
+@pytest.fixture(scope="module")
+def hash_test_file(tmp_path_factory):
+    """
+    Fixture to provide the path to a file holding the shared test content, written once for the module.
+    """
+    file_path = tmp_path_factory.mktemp('hash') / 'content.bin'
+    file_path.write_bytes(b"This is a test file content for hashing.")
+    return str(file_path)
+
 @pytest.mark.parametrize("hash_type_category, expected_hash_key", [
     (HashType.HASH_TYPE_MD5, 'ca9cd1e1b779a6c53da222067617f329'),
     (HashType.HASH_TYPE_SHA256, '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'),
@@ -74,42 +102,137 @@ def test_get_hash_encoder_instance_raise_hash_type_category_unknown():
     (HashType.HASH_TYPE_SHA3_512, 'd0aea0ad35f929cfefadda45a1a5f582f435ef21fdc55a505be59e51fd54c1'
                                   '70b1eb7ef9512db04ec1251288c034062e2e7da59cab7c22f949dd0d6da4bde9ad'),
 ])
-def test_calculate_file_hash_all_hash_types(hash_type_category, expected_hash_key):
+def test_calculate_file_hash_all_hash_types(hash_test_file, hash_type_category, expected_hash_key):
     """
     Test the calculate_file_hash method for all specified hash types.
     """
-    test_content = b"This is a test file content for hashing."
+    hash_key = HashService.calculate_file_hash(hash_test_file, hash_type_category)
+    assert hash_key == expected_hash_key
+
+@pytest.mark.parametrize("buffer_size", [None, 256, 1024, 16384, 32768, 65536])
+def test_calculate_file_hash_all_buffer_sizes(hash_test_file, buffer_size):
+    """
+    Test the calculate_file_hash method for a range of buffer sizes.
+    """
+    expected_key_sha_256 = '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
+
+    if buffer_size is None:
+        hash_key = HashService.calculate_file_hash(hash_test_file, HashType.HASH_TYPE_SHA256)
+    else:
+        hash_key = HashService.calculate_file_hash(hash_test_file, HashType.HASH_TYPE_SHA256, file_buffer_size=buffer_size)
+    assert hash_key == expected_key_sha_256
+
+@pytest.mark.parametrize("hash_type_category, hash_function", [
+    (HashType.HASH_TYPE_MD5, md5),
+    (HashType.HASH_TYPE_SHA256, sha256),
+])
+def test_calculate_file_hash_large_file(hash_type_category, hash_function):
+    """
+    Test the calculate_file_hash method for a file large enough to be memory mapped.
+    """
+    test_content = os.urandom(HashService._mmap_threshold_size + 12345)
     with tempfile.NamedTemporaryFile(delete=False) as temp_file:
         temp_file.write(test_content)
         temp_file_path = temp_file.name
 
     try:
         hash_key = HashService.calculate_file_hash(temp_file_path, hash_type_category)
-        assert hash_key == expected_hash_key
+        assert hash_key == hash_function(test_content).hexdigest()
     finally:
         os.remove(temp_file_path)
 
-@pytest.mark.parametrize("buffer_size", [None, 256, 1024, 16384, 32768, 65536])
-def test_calculate_file_hash_all_buffer_sizes(buffer_size):
+def test_calculate_file_hashes_large_map_slices(mocker):
     """
-    Test the calculate_file_hash method for a range of buffer sizes.
+    Test that calculate_file_hashes feeds a large memory map to several encoders in slices.
     """
-    test_content = b"This is a test file content for hashing."
-    expected_key_sha_256 = '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
+    mocker.patch.object(HashService, '_mmap_threshold_size', 0)
+    mocker.patch.object(HashService, '_mmap_single_update_size', 0)
+    test_content = os.urandom(100003)
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(test_content)
+        temp_file_path = temp_file.name
+
+    try:
+        hash_keys = HashService.calculate_file_hashes(temp_file_path, [HashType.HASH_TYPE_MD5,
+                                                                       HashType.HASH_TYPE_SHA256], file_buffer_size=4096)
+        assert hash_keys == {HashType.HASH_TYPE_MD5: md5(test_content).hexdigest(),
+                             HashType.HASH_TYPE_SHA256: sha256(test_content).hexdigest()}
+    finally:
+        os.remove(temp_file_path)
 
+def test_calculate_file_hash_mmap_unavailable(mocker):
+    """
+    Test that calculate_file_hash falls back to block reads when the file cannot be memory mapped.
+    """
+    mocker.patch.object(HashService, '_mmap_threshold_size', 0)
+    mock_mmap = mocker.patch('feck.file.hash_service.mmap.mmap', side_effect=OSError('mmap not supported'))
+    test_content = b"This is a test file content for hashing."
     with tempfile.NamedTemporaryFile(delete=False) as temp_file:
         temp_file.write(test_content)
         temp_file_path = temp_file.name
 
     try:
-        if buffer_size is None:
-            hash_key = HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256)
-        else:
-            hash_key = HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256, file_buffer_size=buffer_size)
-        assert hash_key == expected_key_sha_256
+        hash_key = HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256, file_buffer_size=7)
+        assert hash_key == '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
+        assert mock_mmap.call_count == 1
+    finally:
+        os.remove(temp_file_path)
+
+def test_calculate_file_hash_mapped_read_error(mocker):
+    """
+    Test that calculate_file_hash propagates a read error of a memory mapped file instead of reading it again.
+    """
+    mocker.patch.object(HashService, '_mmap_threshold_size', 0)
+    mocker.patch.object(HashService, '_update_encoders_from_map', side_effect=OSError('input/output error'))
+    buffers_read_into = []
+
+    class RecordingFileIO(io.FileIO):
+        def readinto(self, buffer):
+            buffers_read_into.append(buffer)
+            return super().readinto(buffer)
+
+    mocker.patch('feck.file.hash_service.io.FileIO', RecordingFileIO)
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(b"This is a test file content for hashing.")
+        temp_file_path = temp_file.name
+
+    try:
+        with pytest.raises(OSError, match='input/output error'):
+            HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256)
+        assert len(buffers_read_into) == 0
     finally:
         os.remove(temp_file_path)
 
+@pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason='posix_fadvise not available')
+def test_calculate_file_hash_sequential_access_hint(mocker):
+    """
+    Test that calculate_file_hash hints sequential access to the kernel.
+    """
+    mock_fadvise = mocker.patch('os.posix_fadvise')
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(b"This is a test file content for hashing.")
+        temp_file_path = temp_file.name
+
+    try:
+        HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_MD5)
+        mock_fadvise.assert_called_once_with(mocker.ANY, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    finally:
+        os.remove(temp_file_path)
+
+@pytest.mark.parametrize("block_size, expected_buffer_size", [
+    (4096, 1 << 20),
+    (1 << 22, 1 << 22),
+    (0, 1 << 20),
+])
+def test_get_default_buffer_size(hash_test_file, block_size, expected_buffer_size):
+    """
+    Test that the default buffer size is the file system block size, at least 1 MiB.
+    """
+    file_stat = os.stat(hash_test_file)
+    file_stat = os.stat_result(tuple(file_stat), {'st_blksize': block_size})
+
+    assert HashService._get_default_buffer_size(file_stat) == expected_buffer_size
+
 @pytest.mark.parametrize("file_buffer_size", [0, -1])
 def test_calculate_file_hash_raise_file_buffer_size_not_positive(file_buffer_size):
     """
@@ -150,6 +273,208 @@ def test_calculate_file_hash_raise_file_not_found(filename):
     with pytest.raises(FileNotFoundError):
         HashService.calculate_file_hash(filename, valid_hash_type, file_buffer_size=valid_buffer_size)
 
+@pytest.mark.parametrize("use_threads", [False, True])
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_calculate_file_hash_batch(tmp_path, max_workers, use_threads):
+    """
+    Test the calculate_file_hash_batch method hashes every file, in the order of the paths.
+    """
+    file_paths = []
+    for index in range(20):
+        file_path = tmp_path / f'file_{index}.bin'
+        file_path.write_bytes(b"This is a test file content for hashing." * index)
+        file_paths.append(str(file_path))
+
+    hash_keys = HashService.calculate_file_hash_batch(file_paths, HashType.HASH_TYPE_MD5, max_workers=max_workers,
+                                                      use_threads=use_threads)
+
+    assert list(hash_keys.keys()) == file_paths
+    for index, file_path in enumerate(file_paths):
+        assert hash_keys[file_path] == md5(b"This is a test file content for hashing." * index).hexdigest()
+
+def test_calculate_file_hash_batch_raise(tmp_path):
+    """
+    Test the calculate_file_hash_batch method with an unknown hash type, an invalid number of workers
+    and a missing file.
+    """
+    file_path = tmp_path / 'file.bin'
+    file_path.write_bytes(b"This is a test file content for hashing.")
+    file_paths = [str(file_path), str(tmp_path / 'not_found.bin')]
+
+    with pytest.raises(ValueError):
+        HashService.calculate_file_hash_batch(file_paths, 1337)
+
+    with pytest.raises(ValueError):
+        HashService.calculate_file_hash_batch(file_paths, HashType.HASH_TYPE_MD5, max_workers=0)
+
+    with pytest.raises(FileNotFoundError):
+        HashService.calculate_file_hash_batch(file_paths, HashType.HASH_TYPE_MD5, max_workers=2)
+
+    with pytest.raises(FileNotFoundError):
+        HashService.calculate_file_hash_batch(file_paths, HashType.HASH_TYPE_MD5, max_workers=2, use_threads=True)
+
+    assert HashService.calculate_file_hash_batch([], HashType.HASH_TYPE_MD5) == {}
+
+def test_calculate_file_hash_small_file_blocks(hash_test_file, mocker):
+    """
+    Test that calculate_file_hash reads a small file in blocks into one reused buffer.
+    """
+    buffers_read_into = []
+
+    class RecordingFileIO(io.FileIO):
+        def readinto(self, buffer):
+            buffers_read_into.append(buffer)
+            return super().readinto(buffer)
+
+    mocker.patch('feck.file.hash_service.io.FileIO', RecordingFileIO)
+
+    hash_key = HashService.calculate_file_hash(hash_test_file, HashType.HASH_TYPE_SHA256, file_buffer_size=16)
+
+    assert hash_key == '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
+    assert len(buffers_read_into) == 4  # three blocks of the 40 bytes, then the end of the file
+    assert all(buffer is buffers_read_into[0] for buffer in buffers_read_into)
+
+def test_calculate_file_hash_size_not_reported(mocker):
+    """
+    Test that calculate_file_hash reads a file reporting a size of zero, such as a procfs file,
+    in blocks of the buffer size rather than in tiny blocks.
+    """
+    test_content = os.urandom(100000)
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(test_content)
+        temp_file_path = temp_file.name
+
+    buffers_read_into = []
+
+    class RecordingFileIO(io.FileIO):
+        def readinto(self, buffer):
+            buffers_read_into.append(buffer)
+            return super().readinto(buffer)
+
+    fstat = os.fstat
+
+    def fstat_size_not_reported(file_descriptor):
+        file_stat = list(fstat(file_descriptor))
+        file_stat[6] = 0  # st_size
+        return os.stat_result(file_stat)
+
+    mocker.patch('feck.file.hash_service.io.FileIO', RecordingFileIO)
+    mocker.patch('feck.file.hash_service.os.fstat', side_effect=fstat_size_not_reported)
+
+    try:
+        hash_key = HashService.calculate_file_hash(temp_file_path, HashType.HASH_TYPE_SHA256, file_buffer_size=65536)
+        assert hash_key == sha256(test_content).hexdigest()
+        assert len(buffers_read_into) == 3  # two blocks of the 100000 bytes, then the end of the file
+    finally:
+        os.remove(temp_file_path)
+
+def test_calculate_file_hashes_large_file_mmap_unavailable(mocker):
+    """
+    Test the calculate_file_hashes method on a large file that cannot be memory mapped, read in blocks.
+    """
+    mock_mmap = mocker.patch('feck.file.hash_service.mmap.mmap', side_effect=OSError('mmap not supported'))
+    test_content = os.urandom(HashService._mmap_threshold_size + 4321)
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(test_content)
+        temp_file_path = temp_file.name
+
+    try:
+        hash_keys = HashService.calculate_file_hashes(temp_file_path, [HashType.HASH_TYPE_MD5, HashType.HASH_TYPE_SHA512],
+                                                      file_buffer_size=65536)
+        assert hash_keys[HashType.HASH_TYPE_MD5] == md5(test_content).hexdigest()
+        assert hash_keys[HashType.HASH_TYPE_SHA512] == sha512(test_content).hexdigest()
+        assert mock_mmap.call_count == 1
+    finally:
+        os.remove(temp_file_path)
+
+@pytest.mark.parametrize("file_size", [40, HashService._mmap_threshold_size + 40])
+def test_calculate_file_hashes(mocker, file_size):
+    """
+    Test that the calculate_file_hashes method computes all hashes in a single pass over the file.
+    """
+    test_content = (b"This is a test file content for hashing." * (file_size // 40 + 1))[:file_size]
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(test_content)
+        temp_file_path = temp_file.name
+
+    try:
+        spy_update = mocker.spy(HashService, '_update_encoders_from_file')
+        hash_types = [HashType.HASH_TYPE_SHA256, HashType.HASH_TYPE_MD5, HashType.HASH_TYPE_SHA256]
+        hash_keys = HashService.calculate_file_hashes(temp_file_path, hash_types, file_buffer_size=1024)
+
+        assert list(hash_keys.keys()) == [HashType.HASH_TYPE_SHA256, HashType.HASH_TYPE_MD5]
+        assert hash_keys[HashType.HASH_TYPE_SHA256] == sha256(test_content).hexdigest()
+        assert hash_keys[HashType.HASH_TYPE_MD5] == md5(test_content).hexdigest()
+        assert spy_update.call_count == 1
+    finally:
+        os.remove(temp_file_path)
+
+@pytest.mark.parametrize("file_size", [40, HashService._mmap_threshold_size + 40])
+def test_calculate_file_hashes_bundle(file_size):
+    """
+    Test that the calculate_file_hashes method computes every hash type in one call, matching each single hash.
+    """
+    test_content = (b"This is a test file content for hashing." * (file_size // 40 + 1))[:file_size]
+    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        temp_file.write(test_content)
+        temp_file_path = temp_file.name
+
+    try:
+        hash_keys = HashService.calculate_file_hashes(temp_file_path, list(HashType))
+
+        assert list(hash_keys.keys()) == list(HashType)
+        for hash_type in HashType:
+            assert hash_keys[hash_type] == HashService.calculate_buffer_hash(test_content, hash_type)
+        if file_size == 40:
+            assert hash_keys[HashType.HASH_TYPE_MD5] == 'ca9cd1e1b779a6c53da222067617f329'
+            assert hash_keys[HashType.HASH_TYPE_SHA256] == \
+                '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
+    finally:
+        os.remove(temp_file_path)
+
+def test_calculate_file_hashes_raise():
+    """
+    Test the calculate_file_hashes method with an unknown hash type, an invalid buffer size and a missing file.
+    """
+    valid_file_path = os.path.join(TEST_DATA_DIRECTORY, 'txt/text_file.txt')
+
+    with pytest.raises(ValueError):
+        HashService.calculate_file_hashes(valid_file_path, [HashType.HASH_TYPE_MD5, 1337])
+
+    with pytest.raises(ValueError):
+        HashService.calculate_file_hashes(valid_file_path, [HashType.HASH_TYPE_MD5], file_buffer_size=0)
+
+    with pytest.raises(FileNotFoundError):
+        HashService.calculate_file_hashes(TEST_DATA_DIRECTORY, [HashType.HASH_TYPE_MD5])
+
+def test_calculate_file_hash_raise_directory_not_file():
+    """
+    Test the calculate_file_hash method when the path directs to an existing directory.
+    """
+    with tempfile.TemporaryDirectory() as temp_directory:
+        with pytest.raises(FileNotFoundError, match='file not found'):
+            HashService.calculate_file_hash(temp_directory, HashType.HASH_TYPE_MD5)
+
+@pytest.mark.skipif(not hasattr(os, 'mkfifo'), reason='named pipes not available')
+def test_calculate_file_hash_raise_fifo_not_file(tmp_path):
+    """
+    Test the calculate_file_hash method when the path directs to a named pipe without a writer,
+    which must be rejected instead of blocking.
+    """
+    fifo_path = str(tmp_path / 'pipe')
+    os.mkfifo(fifo_path)
+
+    with pytest.raises(FileNotFoundError, match='file not found'):
+        HashService.calculate_file_hash(fifo_path, HashType.HASH_TYPE_MD5)
+
+@pytest.mark.skipif(not os.path.exists('/dev/null'), reason='character device /dev/null not available')
+def test_calculate_file_hash_raise_device_not_file():
+    """
+    Test the calculate_file_hash method when the path directs to a character device.
+    """
+    with pytest.raises(FileNotFoundError, match='file not found'):
+        HashService.calculate_file_hash('/dev/null', HashType.HASH_TYPE_MD5)
+
 @pytest.mark.parametrize("hash_type_category, expected_hash_key", [
     (HashType.HASH_TYPE_MD5, 'ca9cd1e1b779a6c53da222067617f329'),
     (HashType.HASH_TYPE_SHA256, '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'),
@@ -157,6 +482,7 @@ def test_calculate_file_hash_raise_file_not_found(filename):
                                 '31bdb6aa65fad3c3fded2a825078c13f4ef62b2b0e229d22db825833a8a5f6f8'),
     (HashType.HASH_TYPE_SHA3_512, 'd0aea0ad35f929cfefadda45a1a5f582f435ef21fdc55a505be59e51fd54c1'
                                   '70b1eb7ef9512db04ec1251288c034062e2e7da59cab7c22f949dd0d6da4bde9ad'),
+    (HashType.HASH_TYPE_XXH3_128, 'a2d0024556dc81546c4e3eb8ce8e6a38'),
 ])
 def test_calculate_buffer_hash(hash_type_category, expected_hash_key):
     """
@@ -167,6 +493,41 @@ def test_calculate_buffer_hash(hash_type_category, expected_hash_key):
     hash_key = HashService.calculate_buffer_hash(buffer, hash_type_category)
     assert hash_key == expected_hash_key
 
+def test_calculate_buffer_hash_sha256_canonical():
+    """
+    Test that the SHA256 encoder, created through the non-security hashlib constructor,
+    is the canonical SHA256 for the fixed vector and across 64-byte block boundaries.
+    """
+    encoder = HashService._get_hash_encoder_instance(HashType.HASH_TYPE_SHA256)
+    assert encoder.name == 'sha256'
+
+    buffer = b"This is a test file content for hashing."
+    assert HashService.calculate_buffer_hash(buffer, HashType.HASH_TYPE_SHA256) == \
+        '730d388b796882f7ae83e0733272094f491b276da07c06372e1d87e19f8190a7'
+
+    large_buffer = buffer * 40000  # spans many blocks and does not end on a block boundary
+    encoder.update(large_buffer[:1000])
+    encoder.update(large_buffer[1000:])
+    assert encoder.hexdigest() == sha256(large_buffer).hexdigest()
+    assert HashService.calculate_buffer_hash(large_buffer, HashType.HASH_TYPE_SHA256) == sha256(large_buffer).hexdigest()
+
+def test_calculate_content_fingerprint(tmp_path):
+    """
+    Test that calculate_content_fingerprint gives the same fingerprint for a buffer and a file of the same content.
+    """
+    buffer = b"This is a test file content for hashing."
+    file_path = tmp_path / 'file.bin'
+    file_path.write_bytes(buffer)
+
+    assert HashService.calculate_content_fingerprint(buffer) == 'a2d0024556dc81546c4e3eb8ce8e6a38'
+    assert HashService.calculate_content_fingerprint(memoryview(buffer)) == 'a2d0024556dc81546c4e3eb8ce8e6a38'
+    assert HashService.calculate_content_fingerprint(str(file_path)) == 'a2d0024556dc81546c4e3eb8ce8e6a38'
+    assert HashService.calculate_content_fingerprint(file_path) == 'a2d0024556dc81546c4e3eb8ce8e6a38'
+    assert HashService.calculate_content_fingerprint(buffer + b'.') != 'a2d0024556dc81546c4e3eb8ce8e6a38'
+
+    with pytest.raises(FileNotFoundError):
+        HashService.calculate_content_fingerprint(str(tmp_path / 'missing.bin'))
+
 def test_calculate_buffer_hash_raise_hash_type_unknown():
     """
     Test the calculate_buffer_hash method when the hash type is unknown.